@@ -1,11 +1,16 @@
 """Interact with getent passwd and the nsswitch backend"""
 
 
+import logging
 import subprocess
+from typing import Dict, Iterable
 
 from .exception import SessionParseError
 
 
+logger = logging.getLogger(__name__)
+
+
 def uid_to_username(uid: int) -> str:
     """Resolve a numeric user ID to a symbolic username
 
@@ -32,3 +37,42 @@ def uid_to_username(uid: int) -> str:
     # error (not recoverable)
     raise RuntimeError(f"Unknown rc {cp.returncode} from getent "
                        f"with stderr: {cp.stderr}")
+
+
+def uids_to_usernames(uids: Iterable[int]) -> Dict[int, str]:
+    """Resolve several numeric user IDs to symbolic usernames at once
+
+    This is the same as uid_to_username, except that all of the UIDs are
+    passed to a single invocation of getent passwd. Any UIDs which could not
+    be found (or whose passwd entries could not be parsed) are simply left out
+    of the returned mapping.
+    """
+
+    keys = [str(uid) for uid in uids]
+    if len(keys) == 0:
+        return {}
+
+    cp = subprocess.run(['/usr/bin/getent', 'passwd'] + keys,
+                        encoding='utf-8',
+                        stderr=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        check=False)
+
+    # From man 1 getent, rc 2 means: "One or more supplied key could not be
+    # found in the database." The others are still printed as usual.
+    if cp.returncode not in (0, 2):
+        # This would be an usual condition, probably indicating a programming
+        # error (not recoverable)
+        raise RuntimeError(f"Unknown rc {cp.returncode} from getent "
+                           f"with stderr: {cp.stderr}")
+
+    usernames: Dict[int, str] = {}
+    for passwd_line in cp.stdout.splitlines():
+        passwd_fields = passwd_line.split(":")
+        if len(passwd_fields) < 3 or not passwd_fields[2].isdigit():
+            # Leave this UID unresolved, so that only the Session(s) belonging
+            # to it are dropped (rather than the whole batch)
+            logger.warning('Skipping invalid passwd entry: "%s"', passwd_line)
+            continue
+        usernames[int(passwd_fields[2])] = passwd_fields[0]
+    return usernames
@@ -2,15 +2,18 @@
 
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 import datetime
-from itertools import product
+import functools
 import logging
 import logging.handlers
+import os
 import re
 import sys
 import traceback
-from typing import List, Mapping, NamedTuple, Optional, Tuple
+from typing import (Collection, Dict, FrozenSet, Iterable, List, NamedTuple,
+                    Optional, Set, Tuple)
 
 from stop_idle_sessions.exception import SessionParseError
 import stop_idle_sessions.getent
@@ -23,6 +26,13 @@ import stop_idle_sessions.x11
 
 logger = logging.getLogger(__name__)
 _DEFAULT_CONFIG_FILE = "/etc/stop-idle-sessions.conf"
+_EXCLUDED_USERS_SEPARATOR_RE = re.compile(r'[,;:]')
+
+# Symbolic usernames which have already been resolved from numeric UIDs. A
+# value of None indicates a UID which could not be resolved at all. This only
+# lives for one run: main() clears it, so that a transient getent failure is
+# retried the next time around.
+_UID_USERNAME_CACHE: Dict[int, Optional[str]] = {}
 
 
 class SessionProcess(NamedTuple):
@@ -46,6 +56,10 @@ class SessionProcess(NamedTuple):
             return False
         return self.process.pid == other.process.pid
 
+    def __hash__(self):
+        # Keep consistent with __eq__, which considers only the PID
+        return hash(self.process.pid)
+
 
 class Session(NamedTuple):
     """Representation of an individual Session, combining various sources"""
@@ -77,6 +91,10 @@ class Session(NamedTuple):
             return False
         return self.session.session_id == other.session.session_id
 
+    def __hash__(self):
+        # Keep consistent with __eq__, which considers only the session ID
+        return hash(self.session.session_id)
+
     def __str__(self):
         return self.string_representation()
 
@@ -110,6 +128,49 @@ class Session(NamedTuple):
                 f'({backend_text}){idleness_text}')
 
 
+def _resolve_usernames(uids: Iterable[int]):
+    """Resolve any UIDs not yet in _UID_USERNAME_CACHE with one getent call
+
+    Both successful and unsuccessful lookups are kept in _UID_USERNAME_CACHE,
+    so that getent is consulted at most once per UID during a run of main().
+    """
+
+    unresolved = sorted(set(uids) - set(_UID_USERNAME_CACHE.keys()))
+    if len(unresolved) > 0:
+        usernames = stop_idle_sessions.getent.uids_to_usernames(unresolved)
+        for uid in unresolved:
+            _UID_USERNAME_CACHE[uid] = usernames.get(uid)
+
+
+def _resolve_username(uid: int) -> str:
+    """Resolve a UID to a username, remembering the result for later calls"""
+
+    _resolve_usernames([uid])
+    username = _UID_USERNAME_CACHE[uid]
+    if username is None:
+        raise SessionParseError(f'Unknown user ID {uid}')
+    return username
+
+
+def _index_loopback_servers(
+        loopback_connections: List[stop_idle_sessions.ss.LoopbackConnection]
+) -> Dict[int, List[stop_idle_sessions.ps.Process]]:
+    """Flatten loopback connections into a map of client PID to server Processes
+
+    This walks each connection (and the Processes on either side of it)
+    exactly once, so that every Process in every Session can look up the
+    server Processes it has tunneled into without revisiting the table.
+    """
+
+    client_pid_to_servers: Dict[int, List[stop_idle_sessions.ps.Process]] = {}
+    for loopback_connection in loopback_connections:
+        server_processes = loopback_connection.server.processes
+        for client_process in loopback_connection.client.processes:
+            client_pid_to_servers.setdefault(client_process.pid,
+                                             []).extend(server_processes)
+    return client_pid_to_servers
+
+
 # Constructing the tree involves many local variables, necessarily
 # pylint: disable-next=too-many-locals, too-many-branches
 def load_sessions() -> List[Session]:
@@ -123,38 +184,38 @@ def load_sessions() -> List[Session]:
                      'information: %s', err.message)
         raise err
 
-    resolved_usernames: Mapping[int, str] = {}
+    client_pid_to_servers = _index_loopback_servers(loopback_connections)
+    _resolve_usernames(logind_session.uid for logind_session in logind_sessions)
 
     # Constructing the tree involves many layers of nesting, necessarily
     # pylint: disable=too-many-nested-blocks
     sessions: List[Session] = []
     display_collector = stop_idle_sessions.x11.X11DisplayCollector()
-    for logind_session in logind_sessions:
-        try:
 
-            if logind_session.uid not in resolved_usernames:
-                username = stop_idle_sessions.getent.uid_to_username(
-                        logind_session.uid
-                )
-                resolved_usernames[logind_session.uid] = username
+    # Reading each scope's process table is independent I/O against sysfs and
+    # /proc, so read all of them concurrently and assemble the results below.
+    with ThreadPoolExecutor() as executor:
+        ps_tables = [executor.submit(stop_idle_sessions.ps.processes_in_scope_path,
+                                     logind_session.scope_path)
+                     for logind_session in logind_sessions]
+
+    for logind_session, ps_table_future in zip(logind_sessions, ps_tables):
+        try:
+            username = _resolve_username(logind_session.uid)
 
             session_processes: List[SessionProcess] = []
-            ps_table = stop_idle_sessions.ps.processes_in_scope_path(
-                    logind_session.scope_path
-            )
+            ps_table = ps_table_future.result()
             for process in ps_table:
                 tunneled_processes: List[stop_idle_sessions.ps.Process] = []
+                tunneled_process_set: Set[stop_idle_sessions.ps.Process] = set()
                 display_collector.add(logind_session.session_id, process)
 
                 # Associate Processes thru loopback to other Processes
-                for loopback_connection in loopback_connections:
-                    client_processes = loopback_connection.client.processes
-                    server_processes = loopback_connection.server.processes
-                    for client_process in client_processes:
-                        for server_process in server_processes:
-                            if process == client_process:
-                                if not server_process in tunneled_processes:
-                                    tunneled_processes.append(server_process)
+                for server_process in client_pid_to_servers.get(process.pid,
+                                                                []):
+                    if server_process not in tunneled_process_set:
+                        tunneled_process_set.add(server_process)
+                        tunneled_processes.append(server_process)
 
                 session_processes.append(SessionProcess(
                         process=process,
@@ -175,7 +236,7 @@ def load_sessions() -> List[Session]:
                     tty=session_tty,
                     display=None,
                     display_idle=None,
-                    username=resolved_usernames[logind_session.uid],
+                    username=username,
                     processes=session_processes
             ))
 
@@ -211,20 +272,30 @@ def load_sessions() -> List[Session]:
                            err.message)
             traceback.print_exc(file=sys.stderr)
 
-    # Go back and resolve backend tunneled Processes to their Sessions
-    for session_a, session_b in product(sessions, sessions):
-        for process_a, process_b in product(session_a.processes,
-                                            session_b.processes):
-            for backend_process_a in process_a.tunneled_processes:
-                if backend_process_a == process_b.process:
-                    process_a.tunneled_sessions.append(session_b)
+    # Go back and resolve backend tunneled Processes to their Sessions. Index
+    # every Session by the PIDs of its Processes first, so that each backend
+    # Process can be resolved with a single lookup.
+    pid_to_session: Dict[int, Session] = {}
+    for session in sessions:
+        for session_process in session.processes:
+            pid_to_session[session_process.process.pid] = session
+
+    for session in sessions:
+        for session_process in session.processes:
+            tunneled_sessions: Set[Session] = set()
+            for backend_process in session_process.tunneled_processes:
+                backend_session = pid_to_session.get(backend_process.pid)
+                if (backend_session is not None and
+                    backend_session not in tunneled_sessions):
+                    tunneled_sessions.add(backend_session)
+                    session_process.tunneled_sessions.append(backend_session)
 
     return sessions
 
 
 def skip_ineligible_session(session: Session,
-                            excluded_users: Optional[List[str]] = None) -> Tuple[bool,
-                                                                                 str]:
+                            excluded_users: Optional[Collection[str]] = None) -> Tuple[bool,
+                                                                                       str]:
     """Check whether a session is ineligible for idleness timeout enforcement
 
     Returns True if this session meets any of the criteria for being
@@ -260,9 +331,50 @@ def skip_ineligible_session(session: Session,
     return False, ''
 
 
+def _latest_local_activity(session: Session,
+                           now: datetime.datetime
+                           ) -> Tuple[Optional[datetime.datetime], str]:
+    """Find the most recent TTY or X11 activity within the Session itself
+
+    Returns the timestamp of that activity (or None, if neither source is
+    available) along with a description of where it came from.
+    """
+
+    last_activity: Optional[datetime.datetime] = None
+    determined_by: str = ""
+
+    tty = session.tty
+    if tty is not None:
+        # The atime on a TTY for a terminal session is touched whenever the
+        # user enters keyboard input.
+        last_activity = tty.atime
+        determined_by = f"atime on {tty.name}"
+
+        # The mtime on a TTY for a terminal session is touched whenever the
+        # user enters keyboard input (same as atime) *OR* whenever a program
+        # generates standard output/error onto the screen.
+        if tty.mtime > last_activity:
+            last_activity = tty.mtime
+            determined_by = f"mtime on {tty.name}"
+
+    # The idleness of a session which contains running some running X11 server
+    # (probably Xwayland or Xorg or Xvnc) can be influenced by the same
+    # activity metric tracked by the X11 Screen Saver extension.
+    if session.display_idle is not None:
+        display_activity = now - session.display_idle
+        if last_activity is None or display_activity > last_activity:
+            last_activity = display_activity
+            determined_by = f"X11 idleness on DISPLAY={session.display}"
+
+    return last_activity, determined_by
+
+
 def compute_idleness_metric(session: Session,
                             now: datetime.datetime,
-                            nested: bool = False) -> datetime.timedelta:
+                            nested: bool = False,
+                            idleness_cache: Optional[Dict[Tuple[str, bool],
+                                                          datetime.timedelta]] = None
+                            ) -> datetime.timedelta:
     """Determine the most "optimistic" idleness metric for the given Session
 
     By drawing from all of the potential sources of idleness/activity, find
@@ -285,33 +397,23 @@ def compute_idleness_metric(session: Session,
     itself, or two sessions relate circularly. As a protection against this,
     the nested argument will keep this function from analyzing further Session
     entries after the first one.
-    """
 
-    minimum_idle: Optional[datetime.timedelta] = None
-    determined_by: str = ""
+    Several sessions may tunnel into the same backend session (e.g., a few
+    SSH sessions into one VNC session). If the caller provides an
+    idleness_cache, then computed metrics are stored there (keyed by session
+    ID and nesting) and reused, rather than being recomputed for each
+    session which refers to them. It should only be shared across calls which
+    use the same value for now.
+    """
 
-    # The atime on a TTY for a terminal session is touched whenever the user
-    # enters keyboard input.
-    if (session.tty is not None and (minimum_idle is None or
-                                     now - session.tty.atime < minimum_idle)):
-        minimum_idle = now - session.tty.atime
-        determined_by = f"atime on {session.tty.name}"
-
-    # The mtime on a TTY for a terminal session is touched whenever the user
-    # enters keyboard input (same as atime) *OR* whenever a program generates
-    # standard output/error onto the screen.
-    if (session.tty is not None and (minimum_idle is None or
-                                     now - session.tty.mtime < minimum_idle)):
-        minimum_idle = now - session.tty.mtime
-        determined_by = f"mtime on {session.tty.name}"
+    cache_key = (session.session.session_id, nested)
+    if idleness_cache is not None and cache_key in idleness_cache:
+        return idleness_cache[cache_key]
 
-    # The idleness of a session which contains running some running X11 server
-    # (probably Xwayland or Xorg or Xvnc) can be influenced by the same
-    # activity metric tracked by the X11 Screen Saver extension.
-    if (session.display_idle is not None and (minimum_idle is None or
-                                              session.display_idle < minimum_idle)):
-        minimum_idle = session.display_idle
-        determined_by = f"X11 idleness on DISPLAY={session.display}"
+    # Rather than comparing a timedelta for each data source, keep track of
+    # the most recent moment of activity and convert it into an idle duration
+    # once at the very end.
+    last_activity, determined_by = _latest_local_activity(session, now)
 
     # The idleness of a session which has tunneled into another session
     # (primarily VNC over SSH) can be influenced by the tunneled session.
@@ -323,28 +425,123 @@ def compute_idleness_metric(session: Session,
             for tunneled_session in session_process.tunneled_sessions:
                 # Do NOT check the inner session for "eligibility"
                 try:
-                    inner_idle = compute_idleness_metric(tunneled_session,
-                                                        now,
-                                                        nested=True)
-                    if minimum_idle is None or inner_idle < minimum_idle:
-                        minimum_idle = inner_idle
+                    inner_activity = now - compute_idleness_metric(
+                            tunneled_session,
+                            now,
+                            nested=True,
+                            idleness_cache=idleness_cache
+                    )
+                    if last_activity is None or inner_activity > last_activity:
+                        last_activity = inner_activity
                         determined_by = ("idleness of nested session " +
                                             tunneled_session.session.session_id)
                 except SessionParseError:
                     # Just skip this attempt if it didn't work out
                     pass
 
-    if minimum_idle is None:
+    if last_activity is None:
         raise SessionParseError('Could not identify an idle duration for ' +
                                 session.session.session_id)
+    minimum_idle = now - last_activity
+
+    # The string representation walks every Process of the Session, so only
+    # build it if it's actually going to be logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Computed idleness for %s (based on %s)",
+                     session.string_representation(minimum_idle),
+                     determined_by)
 
-    logger.debug("Computed idleness for %s (based on %s)",
-                 session.string_representation(minimum_idle),
-                 determined_by)
+    if idleness_cache is not None:
+        idleness_cache[cache_key] = minimum_idle
 
     return minimum_idle
 
 
+class Configuration(NamedTuple):
+    """Settings parsed out of the INI format configuration file"""
+
+    # Don't actually terminate any sessions, but just log what would happen
+    dry_run: bool
+
+    # Write logged messages to syslog instead of stdout
+    syslog: bool
+
+    # Incorporate debug logs (into debug_log, if sending to syslog)
+    verbose: bool
+
+    # Path to a file which receives debug logs while using syslog (or blank)
+    debug_log: str
+
+    # Usernames whose sessions are never terminated
+    excluded_users: FrozenSet[str]
+
+    # Number of idle minutes after which a session is terminated
+    timeout: int
+
+
+def _config_file_mtime_ns(config_file: str) -> Optional[int]:
+    """Identify the modification time of the config file (if it exists)"""
+    try:
+        return os.stat(config_file).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_file: str, mtime_ns: Optional[int]) -> Configuration:
+    """Read and parse the configuration file, falling back to the defaults
+
+    Results are cached by path and modification time, so that a process
+    which calls main() repeatedly doesn't reread an unchanged file.
+    """
+
+    # The mtime_ns is only there to invalidate the cache when the file changes
+    # pylint: disable=unused-argument
+
+    config = configparser.ConfigParser()
+    config['stop-idle-sessions'] = {
+            'dry-run': 'no',
+            'syslog': 'no',
+            'verbose': 'no',
+            'debug-log': '',
+            'excluded-users': '',
+            'timeout': '15'
+    }
+
+    try:
+        with open(config_file, "r", encoding='utf-8') as config_f:
+            config.read_file(config_f, source=config_file)
+    except OSError as err:
+        # If it was the default file that failed to open, then just ignore the
+        # failure. Otherwise, this is a fatal condition.
+        if config_file != _DEFAULT_CONFIG_FILE:
+            logger.error('Problem while reading a custom config file '
+                         'located at %s: %s',
+                         config_file,
+                         str(err))
+            raise err
+
+    try:
+        return Configuration(
+                dry_run=config.getboolean('stop-idle-sessions', 'dry-run'),
+                syslog=config.getboolean('stop-idle-sessions', 'syslog'),
+                verbose=config.getboolean('stop-idle-sessions', 'verbose'),
+                debug_log=config.get('stop-idle-sessions', 'debug-log'),
+                excluded_users=frozenset(
+                    user.strip()
+                    for user in _EXCLUDED_USERS_SEPARATOR_RE.split(
+                        config.get('stop-idle-sessions', 'excluded-users')
+                    )
+                    if user.strip() != ""
+                ),
+                timeout=config.getint('stop-idle-sessions', 'timeout')
+        )
+    except ValueError as err:
+        logger.error('Problem while parsing arguments: %s',
+                     str(err))
+        raise err
+
+
 # This is a bit complicated, but it's the glue for everything else.
 # pylint: disable-next=too-many-branches, too-many-locals, too-many-statements
 def main():
@@ -375,51 +572,16 @@ def main():
 
     args = parser.parse_args()
 
-    config = configparser.ConfigParser()
-    config['stop-idle-sessions'] = {
-            'dry-run': 'no',
-            'syslog': 'no',
-            'verbose': 'no',
-            'debug-log': '',
-            'excluded-users': '',
-            'timeout': '15'
-    }
-
-    try:
-        with open(args.config_file, "r", encoding='utf-8') as config_f:
-            config.read_file(config_f, source=args.config_file)
-    except OSError as err:
-        # If it was the default file that failed to open, then just ignore the
-        # failure. Otherwise, this is a fatal condition.
-        if args.config_file != _DEFAULT_CONFIG_FILE:
-            logger.error('Problem while reading a custom config file '
-                         'located at %s: %s',
-                         args.config_file,
-                         str(err))
-            raise err
-
-    try:
-        dry_run: bool = config.getboolean('stop-idle-sessions', 'dry-run')
-        syslog: bool = config.getboolean('stop-idle-sessions', 'syslog')
-        verbose: bool = config.getboolean('stop-idle-sessions', 'verbose')
-        debug_log: str = config.get('stop-idle-sessions', 'debug-log')
-        excluded_users: List[str] = list(map(lambda x: x.strip(),
-                                             re.split(r'[,;:]',
-                                                      config.get('stop-idle-sessions',
-                                                                 'excluded-users'))))
-        timeout: int = config.getint('stop-idle-sessions', 'timeout')
-    except ValueError as err:
-        logger.error('Problem while parsing arguments: %s',
-                     str(err))
-        raise err
+    config = _load_config(args.config_file,
+                          _config_file_mtime_ns(args.config_file))
 
     # Command-line argument can override the config bools
-    if args.dry_run:
-        dry_run = True
-    if args.syslog:
-        syslog = True
-    if args.verbose:
-        verbose = True
+    dry_run = config.dry_run or args.dry_run
+    syslog = config.syslog or args.syslog
+    verbose = config.verbose or args.verbose
+    debug_log = config.debug_log
+    excluded_users = config.excluded_users
+    timeout = config.timeout
 
     if syslog:
         syslog_handler = logging.handlers.SysLogHandler(address='/dev/log')
@@ -438,12 +600,21 @@ def main():
         logging.basicConfig(level=logging.DEBUG)
 
     now = datetime.datetime.now()
+    _UID_USERNAME_CACHE.clear()
+    idleness_cache: Dict[Tuple[str, bool], datetime.timedelta] = {}
     sessions = load_sessions()
     for session in sessions:
         skip_session, why = skip_ineligible_session(session, excluded_users)
 
+        # An ineligible session is never terminated, so its idletime would
+        # only be reported in the debug log. Don't compute it otherwise.
+        if skip_session and not logger.isEnabledFor(logging.DEBUG):
+            continue
+
         try:
-            idletime = compute_idleness_metric(session, now)
+            idletime = compute_idleness_metric(session,
+                                               now,
+                                               idleness_cache=idleness_cache)
 
             if idletime >= datetime.timedelta(seconds=60 * timeout):
                 if skip_session:
@@ -459,9 +630,10 @@ def main():
                     session.session.kill_session_leader()
 
         except SessionParseError as err:
-            logger.debug('Could not determine idletime for %s (%s)',
-                         session.string_representation(),
-                         err.message)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Could not determine idletime for %s (%s)',
+                             session.string_representation(),
+                             err.message)
             if not skip_session:
                 raise err
 
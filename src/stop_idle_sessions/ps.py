@@ -32,6 +32,10 @@ class Process(NamedTuple):
 
         return True
 
+    def __hash__(self):
+        # Keep consistent with __eq__, which considers only the PID
+        return hash(self.pid)
+
 
 def process_by_pid(pid: int) -> Process:
     """Obtain a specific Process by its PID"""
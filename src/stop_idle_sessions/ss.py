@@ -4,12 +4,38 @@
 from ipaddress import IPv4Address, IPv6Address, ip_address
 import re
 import subprocess
-from typing import List, NamedTuple, Tuple, Union
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Tuple, Union
 
 from . import list_set, ps
 from .exception import SessionParseError
 
 
+# These patterns are used for every line of every `ss` invocation, so they are
+# only compiled once.
+
+# LISTEN 0 128 0.0.0.0:22 0.0.0.0:* users:(("sshd",pid=5533,fd=3))
+_SOCKET_RE = re.compile(r'^(?P<State>[-A-Z0-9]+)\s+'
+                        r'(?P<RecvQ>\d+)\s+'
+                        r'(?P<SendQ>\d+)\s+'
+                        r'\[?(?P<LocalAddress>[:.0-9a-fA-F]+|\*)\]?:'
+                        r'(?P<LocalPort>\d+)\s+'
+                        r'\[?(?P<PeerAddress>[:.0-9a-fA-F]+|\*)\]?:'
+                        r'(?P<PeerPort>\d+|\*)\s*'
+                        r'(users:\((?P<Process>.*)\))?\s*$')
+
+# ("rpcbind",pid=4935,fd=4),("systemd",pid=1,fd=327)
+_PAREN_RE = re.compile(r'[()]')
+_COMM_RE = re.compile(r'^"(.*)"$')
+_PID_RE = re.compile(r'^pid=(\d+)$')
+# UNUSED
+#_FD_RE = re.compile(r'^fd=(\d+)$')
+
+# ss cannot tell us anything about a process's environment, so every Process
+# it reports shares this single read-only (and empty) mapping
+_NO_ENVIRON: Mapping[str, str] = MappingProxyType({})
+
+
 class Socket(NamedTuple):
     """Represent a socket potentially associated with several processes
 
@@ -98,8 +124,6 @@ class SSInvocation:
         self.established_sockets = []
         self.loopback_connections = []
 
-    # There are a lot of local variables, but it's a complex problem
-    # pylint: disable-next=too-many-locals
     def step_1_obtain_raw_ss_data(self):
         """Run 'ss' and populate the initial collections
 
@@ -124,25 +148,8 @@ class SSInvocation:
             raise SessionParseError('Could not read network connections from '
                                     'system `ss` command') from err
 
-        # LISTEN 0 128 0.0.0.0:22 0.0.0.0:* users:(("sshd",pid=5533,fd=3))
-        socket_re = re.compile(r'^(?P<State>[-A-Z0-9]+)\s+'
-                            r'(?P<RecvQ>\d+)\s+'
-                            r'(?P<SendQ>\d+)\s+'
-                            r'\[?(?P<LocalAddress>[:.0-9a-fA-F]+|\*)\]?:'
-                            r'(?P<LocalPort>\d+)\s+'
-                            r'\[?(?P<PeerAddress>[:.0-9a-fA-F]+|\*)\]?:'
-                            r'(?P<PeerPort>\d+|\*)\s*'
-                            r'(users:\((?P<Process>.*)\))?\s*$')
-
-        # ("rpcbind",pid=4935,fd=4),("systemd",pid=1,fd=327)
-        paren_re = re.compile(r'[()]')
-        comm_re = re.compile(r'^"(.*)"$')
-        pid_re = re.compile(r'^pid=(\d+)$')
-        # UNUSED
-        #fd_re = re.compile(r'^fd=(\d+)$')
-
         for socket_line in cp.stdout.splitlines():
-            socket_match = socket_re.match(socket_line)
+            socket_match = _SOCKET_RE.match(socket_line)
             if socket_match is None:
                 raise ValueError(f'invalid socket spec detected: '
                                  f'"{socket_line}"')
@@ -150,7 +157,7 @@ class SSInvocation:
             processes: List[ps.Process] = []
             if socket_match.group('Process') is not None:
                 process_clause = socket_match.group('Process')
-                process_without_parens = paren_re.sub('', process_clause)
+                process_without_parens = _PAREN_RE.sub('', process_clause)
                 process_parts = process_without_parens.split(',')
 
                 if len(process_parts) % 3 != 0:
@@ -160,8 +167,8 @@ class SSInvocation:
                 for base in range(0, len(process_parts) // 3):
                     individual_parts = process_parts[base*3:(base+1)*3]
 
-                    comm_match = comm_re.match(individual_parts[0])
-                    pid_match = pid_re.match(individual_parts[1])
+                    comm_match = _COMM_RE.match(individual_parts[0])
+                    pid_match = _PID_RE.match(individual_parts[1])
                     if (comm_match is None or
                         pid_match is None):
                         raise SessionParseError(f'invalid process spec '
@@ -169,9 +176,9 @@ class SSInvocation:
 
                     processes.append(ps.Process(
                         pid=int(pid_match.group(1)),
-                        # This needs to be blank -- we can't get it from ss
+                        # These need to be blank -- we can't get them from ss
                         cmdline="",
-                        environ={}
+                        environ=_NO_ENVIRON
                     ))
 
             if socket_match.group('State') == 'LISTEN':
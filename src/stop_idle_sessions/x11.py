@@ -3,9 +3,10 @@
 
 from collections import defaultdict
 from datetime import timedelta
+import logging
 import os
 import re
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Optional, Set, Tuple, Union
 
 import Xlib.display
 import Xlib.error
@@ -14,6 +15,9 @@ from .exception import SessionParseError
 from .ps import Process
 
 
+logger = logging.getLogger(__name__)
+
+
 class X11DisplayCollector:
     """Collect related Process objects to determine X11 params across sessions
 
@@ -41,6 +45,12 @@ class X11DisplayCollector:
         # more individual XAUTHORITY candidates.
         self._display_xauthorities: Dict[str, Set[str]] = defaultdict(set)
 
+        # Results (or failures) of idletime queries which have already been
+        # made for a DISPLAY and XAUTHORITY pair.
+        self._idletimes: Dict[Tuple[str, str],
+                              Union[Optional[timedelta],
+                                    SessionParseError]] = {}
+
     def add(self, session: str, process: Process):
         """Add information from a Process and its session ID to tracking
 
@@ -98,10 +108,7 @@ class X11DisplayCollector:
         for display in self._session_displays[session]:
             for xauthority in self._display_xauthorities[display]:
                 try:
-                    candidate_idletime = X11DisplayCollector.retrieve_idle_time(
-                            display,
-                            xauthority
-                    )
+                    candidate_idletime = self._idletime(display, xauthority)
                     if candidate_idletime is not None:
                         if result is None:
                             result = (display, candidate_idletime)
@@ -122,6 +129,29 @@ class X11DisplayCollector:
             raise any_exception
         return None
 
+    def _idletime(self, display: str, xauthority: str) -> Optional[timedelta]:
+        """Query the idletime for a DISPLAY, reusing any earlier result
+
+        Several sessions often share the same DISPLAY and XAUTHORITY pair
+        (e.g., an x11vnc relay), so each pair is only queried once.
+        """
+
+        if (display, xauthority) not in self._idletimes:
+            try:
+                self._idletimes[(display, xauthority)] = (
+                        X11DisplayCollector.retrieve_idle_time(display,
+                                                               xauthority)
+                )
+            except SessionParseError as err:
+                self._idletimes[(display, xauthority)] = err
+
+        result = self._idletimes[(display, xauthority)]
+        if isinstance(result, SessionParseError):
+            # Raise a fresh error for each caller, rather than re-raising the
+            # stored one and growing its traceback every time
+            raise SessionParseError(result.message) from result
+        return result
+
     @staticmethod
     def parse_xserver_cmdline(cmdline: str) -> Tuple[Optional[str],
                                                      Optional[str]]:
@@ -176,14 +206,28 @@ class X11DisplayCollector:
                 os.environ['XAUTHORITY'] = xauthority
 
             d = Xlib.display.Display(display)
-            if d.has_extension('MIT-SCREEN-SAVER'):
-                idle_time_ms = d.screen().root.screensaver_query_info().idle
-                return timedelta(milliseconds=idle_time_ms)
 
-            # The DISPLAY doesn't support the screen saver extension, which
+            # Each DISPLAY is only queried once per collection, so don't keep
+            # its connection open any longer than that.
+            # The DISPLAY may not support the screen saver extension, which
             # means it is probably either forwarded (X11) or running a GDM
             # login session.
-            return None
+            idle_time: Optional[timedelta] = None
+            try:
+                if d.has_extension('MIT-SCREEN-SAVER'):
+                    idle_time_ms = d.screen().root.screensaver_query_info().idle
+                    idle_time = timedelta(milliseconds=idle_time_ms)
+            finally:
+                # Closing flushes the connection, which fails if the server
+                # (or its tunnel) went away after replying. Any idletime which
+                # was already read is still good.
+                try:
+                    d.close()
+                except (Xlib.error.ConnectionClosedError, OSError) as err:
+                    logger.debug('Could not cleanly close the X11 display '
+                                 'identified by "%s": %s', display, err)
+
+            return idle_time
 
         except Xlib.error.DisplayConnectionError as err:
             raise SessionParseError(f'Could not connect to X11 display identified '
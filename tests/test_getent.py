@@ -36,3 +36,43 @@ class UidToUsernameTestCase(TestCase):
             with self.assertRaises(SessionParseError):
                 stop_idle_sessions.getent.uid_to_username(1000)
             mock_run.assert_called()
+
+
+class UidsToUsernamesTestCase(TestCase):
+    """Unit-testing for the batched getent passwd command wrapper"""
+
+    def test_partial_name_resolution(self):
+        """Verify that found users are returned even if others are missing"""
+        completed_process = Mock()
+        completed_process.stdout = ("root:x:0:0:root:/root:/bin/bash\n"
+                                    "auser:x:1000:1000:A User:/home/auser:/bin/bash\n")
+        completed_process.stderr = ""
+        completed_process.returncode = 2
+
+        with patch('subprocess.run',
+                   new=Mock(return_value=completed_process)) as mock_run:
+            actual_users = stop_idle_sessions.getent.uids_to_usernames([0, 1000, 1001])
+            self.assertEqual({0: 'root', 1000: 'auser'}, actual_users)
+            mock_run.assert_called_once()
+            self.assertEqual(['/usr/bin/getent', 'passwd', '0', '1000', '1001'],
+                             mock_run.call_args[0][0])
+
+    def test_invalid_passwd_entry(self):
+        """Verify that unparseable entries are skipped rather than raised"""
+        completed_process = Mock()
+        completed_process.stdout = ("root:x:0:0:root:/root:/bin/bash\n"
+                                    "garbage\n"
+                                    "buser:x:notanumber:1001::/home/buser:/bin/bash\n")
+        completed_process.stderr = ""
+        completed_process.returncode = 0
+
+        with patch('subprocess.run', new=Mock(return_value=completed_process)):
+            with self.assertLogs('stop_idle_sessions.getent', level='WARNING'):
+                actual_users = stop_idle_sessions.getent.uids_to_usernames([0, 1001])
+            self.assertEqual({0: 'root'}, actual_users)
+
+    def test_no_uids_requested(self):
+        """Verify that getent is not run at all for an empty batch"""
+        with patch('subprocess.run', new=Mock()) as mock_run:
+            self.assertEqual({}, stop_idle_sessions.getent.uids_to_usernames([]))
+            mock_run.assert_not_called()
@@ -1,8 +1,14 @@
 """Common logic for the main loop, shared across all scenarios"""
 
 
+from contextlib import redirect_stderr
 import datetime
-from typing import Dict, List, Optional, Tuple
+import io
+from ipaddress import ip_address
+import logging
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
 from unittest import TestCase, TestSuite
 from unittest.mock import Mock, patch
 
@@ -102,12 +108,19 @@ class MainLoopTestCase(TestCase):
         processes_in_scope_path_patcher.start()
         self.addCleanup(processes_in_scope_path_patcher.stop)
 
-        uid_to_username_patcher = patch(
-                'stop_idle_sessions.getent.uid_to_username',
-                new=Mock(side_effect=self._mock_uid_to_username)
+        uids_to_usernames_patcher = patch(
+                'stop_idle_sessions.getent.uids_to_usernames',
+                new=Mock(side_effect=self._wrap_mock_uids_to_usernames)
         )
-        uid_to_username_patcher.start()
-        self.addCleanup(uid_to_username_patcher.stop)
+        uids_to_usernames_patcher.start()
+        self.addCleanup(uids_to_usernames_patcher.stop)
+
+        uid_username_cache_patcher = patch.dict(
+                'stop_idle_sessions.main._UID_USERNAME_CACHE',
+                clear=True
+        )
+        uid_username_cache_patcher.start()
+        self.addCleanup(uid_username_cache_patcher.stop)
 
         retrieve_idle_time_patcher = patch(
                 'stop_idle_sessions.x11.X11DisplayCollector.retrieve_idle_time',
@@ -230,6 +243,117 @@ class MainLoopTestCase(TestCase):
                 else:
                     kill_mock.assert_not_called()
 
+    def test_shared_idleness_cache(self):
+        """Ensure that sharing an idleness_cache doesn't change any metrics
+
+        This mirrors the main loop, which shares one cache across all of the
+        sessions that it reviews. Nested sessions are then reused from the
+        cache rather than being recomputed.
+        """
+
+        actual_sessions = stop_idle_sessions.main.load_sessions()
+        idleness_cache: Dict[Tuple[str, bool], datetime.timedelta] = {}
+
+        for session in actual_sessions:
+            try:
+                uncached_idle_metric = stop_idle_sessions.main.compute_idleness_metric(
+                        session,
+                        self._now()
+                )
+            except SessionParseError:
+                with self.assertRaises(SessionParseError):
+                    stop_idle_sessions.main.compute_idleness_metric(
+                            session,
+                            self._now(),
+                            idleness_cache=idleness_cache
+                    )
+                continue
+
+            cached_idle_metric = stop_idle_sessions.main.compute_idleness_metric(
+                    session,
+                    self._now(),
+                    idleness_cache=idleness_cache
+            )
+            self.assertEqual(uncached_idle_metric, cached_idle_metric)
+            self.assertEqual(idleness_cache[(session.session.session_id, False)],
+                             cached_idle_metric)
+
+    def test_idleness_cache_hit(self):
+        """Ensure that a cached metric is returned instead of being recomputed
+
+        Each nested session is pre-seeded with a marker idletime of zero,
+        which no real data source in the scenario would produce. Any session
+        which tunnels into one should then pick up that marker from the cache.
+        """
+
+        actual_sessions = stop_idle_sessions.main.load_sessions()
+        marker = datetime.timedelta(0)
+
+        for session in actual_sessions:
+            # A session's own cache entry is returned as-is
+            idleness_cache = {(session.session.session_id, False): marker}
+            self.assertEqual(marker,
+                             stop_idle_sessions.main.compute_idleness_metric(
+                                     session,
+                                     self._now(),
+                                     idleness_cache=idleness_cache
+                             ))
+
+            tunneled_sessions = [
+                tunneled_session
+                for session_process in session.processes
+                for tunneled_session in session_process.tunneled_sessions
+            ]
+            if len(tunneled_sessions) == 0:
+                continue
+
+            # ... and so is the cache entry for any nested session
+            idleness_cache = {(tunneled_session.session.session_id, True): marker
+                              for tunneled_session in tunneled_sessions}
+            self.assertEqual(marker,
+                             stop_idle_sessions.main.compute_idleness_metric(
+                                     session,
+                                     self._now(),
+                                     idleness_cache=idleness_cache
+                             ))
+
+    def test_scope_failure_drops_only_its_session(self):
+        """Ensure that one unreadable scope doesn't disturb the other sessions
+
+        The scope process tables are read concurrently, so this also checks
+        that each remaining session is still paired with its own processes
+        (and that the sessions keep their original order).
+        """
+
+        reference_sessions = stop_idle_sessions.main.load_sessions()
+
+        for failed_session in reference_sessions:
+            failed_scope_path = failed_session.session.scope_path
+
+            # Bind failed_scope_path now, rather than at call time
+            def failing_processes_in_scope_path(scope_path,
+                                                failed_scope_path=failed_scope_path):
+                if scope_path == failed_scope_path:
+                    raise SessionParseError(f'Could not read {scope_path}')
+                return self._mock_processes_in_scope_path(scope_path)
+
+            with patch('stop_idle_sessions.ps.processes_in_scope_path',
+                       new=Mock(side_effect=failing_processes_in_scope_path)), \
+                    self.assertLogs('stop_idle_sessions.main', level='WARNING'), \
+                    redirect_stderr(io.StringIO()):
+                actual_sessions = stop_idle_sessions.main.load_sessions()
+
+            expected_sessions = [session for session in reference_sessions
+                                 if session.session.scope_path != failed_scope_path]
+            self.assertEqual(
+                    [(session.session.session_id,
+                      [p.process.pid for p in session.processes])
+                     for session in expected_sessions],
+                    [(session.session.session_id,
+                      [p.process.pid for p in session.processes])
+                     for session in actual_sessions]
+            )
+
     #
     # Internal methods used by test cases -- these should not be overridden
     #
@@ -256,6 +380,21 @@ class MainLoopTestCase(TestCase):
 
         return sessions
 
+    def _wrap_mock_uids_to_usernames(self, uids: Iterable[int]) -> Dict[int, str]:
+        """Batch the _mock_uid_to_username output like getent.uids_to_usernames
+
+        Any UID which the scenario doesn't know about is left out of the
+        result, the same way that getent omits keys it could not find.
+        """
+
+        usernames: Dict[int, str] = {}
+        for uid in uids:
+            try:
+                usernames[uid] = self._mock_uid_to_username(uid)
+            except KeyError:
+                pass
+        return usernames
+
     #
     # Internal attributes used by test cases -- subclasses shouldn't use these
     #
@@ -264,15 +403,329 @@ class MainLoopTestCase(TestCase):
     _mocked_killed_session_leaders: Dict[str, Mock]
 
 
-def load_tests(*_):
+class TunneledSessionsTestCase(TestCase):
+    """Unit testing for the tunneling associations made by load_sessions
+
+    Unlike MainLoopTestCase, this is run directly. It covers one client
+    Process which holds several loopback connections (one of them repeated)
+    into two server Processes of the same backend Session.
+    """
+
+    def setUp(self):
+        self._logind_sessions = [
+            Mock(spec_set=stop_idle_sessions.logind.Session,
+                 session_id="A",
+                 session_type="tty",
+                 uid=1000,
+                 tty="",
+                 leader=100,
+                 scope="session-A.scope",
+                 scope_path="/user.slice/user-1000.slice/session-A.scope"),
+            Mock(spec_set=stop_idle_sessions.logind.Session,
+                 session_id="B",
+                 session_type="tty",
+                 uid=1000,
+                 tty="",
+                 leader=200,
+                 scope="session-B.scope",
+                 scope_path="/user.slice/user-1000.slice/session-B.scope")
+        ]
+
+        client = stop_idle_sessions.ps.Process(pid=100, cmdline="", environ={})
+        server_200 = stop_idle_sessions.ps.Process(pid=200, cmdline="", environ={})
+        server_201 = stop_idle_sessions.ps.Process(pid=201, cmdline="", environ={})
+        scope_processes = {
+            "/user.slice/user-1000.slice/session-A.scope": [client],
+            "/user.slice/user-1000.slice/session-B.scope": [server_200,
+                                                            server_201]
+        }
+
+        loopback_connections = [
+            stop_idle_sessions.ss.LoopbackConnection(
+                    client=stop_idle_sessions.ss.Socket(
+                        addr=ip_address('127.0.0.1'),
+                        port=port,
+                        processes=[client]
+                    ),
+                    server=stop_idle_sessions.ss.Socket(
+                        addr=ip_address('127.0.0.1'),
+                        port=server_port,
+                        processes=[server]
+                    )
+            )
+            for port, server_port, server in ((40000, 5901, server_200),
+                                              (40001, 5902, server_201),
+                                              (40002, 5901, server_200))
+        ]
+
+        patchers = [
+            patch('stop_idle_sessions.logind.get_all_sessions',
+                  new=Mock(return_value=self._logind_sessions)),
+            patch('stop_idle_sessions.ss.find_loopback_connections',
+                  new=Mock(return_value=loopback_connections)),
+            patch('stop_idle_sessions.ps.processes_in_scope_path',
+                  new=Mock(side_effect=scope_processes.__getitem__)),
+            patch('stop_idle_sessions.getent.uids_to_usernames',
+                  new=Mock(return_value={1000: 'auser'})),
+            patch.dict('stop_idle_sessions.main._UID_USERNAME_CACHE',
+                       clear=True)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tunneled_targets_are_unique(self):
+        """Each server Process and backend Session is only associated once"""
+
+        sessions = stop_idle_sessions.main.load_sessions()
+        self.assertEqual(["A", "B"],
+                         [session.session.session_id for session in sessions])
+
+        client_process = sessions[0].processes[0]
+        self.assertEqual([200, 201],
+                         [process.pid
+                          for process in client_process.tunneled_processes])
+        self.assertEqual(["B"],
+                         [session.session.session_id
+                          for session in client_process.tunneled_sessions])
+
+        for server_process in sessions[1].processes:
+            self.assertEqual([], server_process.tunneled_processes)
+            self.assertEqual([], server_process.tunneled_sessions)
+
+        self.assertEqual(str(sessions[0]),
+                         'session id="A" leader=100 user=auser@notty '
+                         '(w/ 1 processes hosting 2 to 1 backend sessions)')
+
+
+class LoadConfigTestCase(TestCase):
+    """Unit testing for the (cached) configuration file parser
+
+    Unlike MainLoopTestCase, this is run directly.
+    """
+
+    # The parser itself is private to the main module
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self._temp_dir = temp_dir.name
+
+        default_config_file_patcher = patch(
+                'stop_idle_sessions.main._DEFAULT_CONFIG_FILE',
+                new=os.path.join(self._temp_dir, 'default.conf')
+        )
+        default_config_file_patcher.start()
+        self.addCleanup(default_config_file_patcher.stop)
+
+        stop_idle_sessions.main._load_config.cache_clear()
+        self.addCleanup(stop_idle_sessions.main._load_config.cache_clear)
+
+    def test_missing_default_config_file(self):
+        """A missing default config file just leaves the defaults in place"""
+
+        config_file = stop_idle_sessions.main._DEFAULT_CONFIG_FILE
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(
+                        config_file,
+                        stop_idle_sessions.main._config_file_mtime_ns(config_file)
+                ),
+                stop_idle_sessions.main.Configuration(
+                        dry_run=False,
+                        syslog=False,
+                        verbose=False,
+                        debug_log='',
+                        excluded_users=frozenset(),
+                        timeout=15
+                )
+        )
+
+    def test_custom_config_file(self):
+        """A custom config file overrides the defaults that it mentions"""
+
+        config_file = self._write_config_file('custom.conf',
+                                              'dry-run = yes\n'
+                                              'excluded-users = a; b ,,\n'
+                                              'timeout = 30\n')
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(
+                        config_file,
+                        stop_idle_sessions.main._config_file_mtime_ns(config_file)
+                ),
+                stop_idle_sessions.main.Configuration(
+                        dry_run=True,
+                        syslog=False,
+                        verbose=False,
+                        debug_log='',
+                        excluded_users=frozenset({'a', 'b'}),
+                        timeout=30
+                )
+        )
+
+    def test_missing_custom_config_file(self):
+        """A missing custom config file is fatal, and the failure isn't cached"""
+
+        config_file = os.path.join(self._temp_dir, 'custom.conf')
+        mtime_ns = stop_idle_sessions.main._config_file_mtime_ns(config_file)
+        self.assertIsNone(mtime_ns)
+
+        with self.assertLogs('stop_idle_sessions.main', level='ERROR'):
+            with self.assertRaises(OSError):
+                stop_idle_sessions.main._load_config(config_file, mtime_ns)
+
+        # Even with the very same arguments, the file is tried again
+        self._write_config_file('custom.conf', 'timeout = 30\n')
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(config_file, mtime_ns).timeout,
+                30
+        )
+
+    def test_changed_config_file(self):
+        """A new modification time causes the config file to be reread"""
+
+        config_file = self._write_config_file('custom.conf', 'timeout = 30\n')
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        old_mtime_ns = stop_idle_sessions.main._config_file_mtime_ns(config_file)
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(config_file,
+                                                     old_mtime_ns).timeout,
+                30
+        )
+
+        self._write_config_file('custom.conf', 'timeout = 45\n')
+        os.utime(config_file, ns=(2_000_000_000, 2_000_000_000))
+        new_mtime_ns = stop_idle_sessions.main._config_file_mtime_ns(config_file)
+        self.assertNotEqual(old_mtime_ns, new_mtime_ns)
+
+        # The old modification time is still answered from the cache...
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(config_file,
+                                                     old_mtime_ns).timeout,
+                30
+        )
+        # ... but the new one is parsed afresh
+        self.assertEqual(
+                stop_idle_sessions.main._load_config(config_file,
+                                                     new_mtime_ns).timeout,
+                45
+        )
+
+    def _write_config_file(self, name: str, settings: str) -> str:
+        """Write a config file into the temporary directory and return its path"""
+
+        config_file = os.path.join(self._temp_dir, name)
+        with open(config_file, 'w', encoding='utf-8') as config_f:
+            config_f.write('[stop-idle-sessions]\n' + settings)
+        return config_file
+
+
+class SkipIneligibleSessionTestCase(TestCase):
+    """Unit testing for the handling of ineligible sessions by main()
+
+    Unlike MainLoopTestCase, this is run directly. It covers one graphical
+    session, whose idletime is only worth computing for the debug log.
+    """
+
+    # The config parser cache is private to the main module
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self._session = stop_idle_sessions.main.Session(
+                session=Mock(spec_set=stop_idle_sessions.logind.Session,
+                             session_id="A",
+                             session_type="x11",
+                             uid=1000,
+                             tty="",
+                             leader=100,
+                             scope="session-A.scope",
+                             scope_path="/user.slice/user-1000.slice/session-A.scope"),
+                tty=None,
+                display=":1",
+                display_idle=None,
+                username="auser",
+                processes=[]
+        )
+        self._mocked_compute_idleness_metric = Mock(
+                return_value=datetime.timedelta(hours=1)
+        )
+
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+
+        patchers = [
+            patch('sys.argv', new=['stop_idle_sessions.main', '--dry-run']),
+            patch('stop_idle_sessions.main._DEFAULT_CONFIG_FILE',
+                  new=os.path.join(temp_dir.name, 'default.conf')),
+            patch('stop_idle_sessions.main.load_sessions',
+                  new=Mock(return_value=[self._session])),
+            patch('stop_idle_sessions.main.compute_idleness_metric',
+                  new=self._mocked_compute_idleness_metric)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        stop_idle_sessions.main._load_config.cache_clear()
+        self.addCleanup(stop_idle_sessions.main._load_config.cache_clear)
+
+        logger = stop_idle_sessions.main.logger
+        self.addCleanup(logger.setLevel, logger.level)
+
+    def test_ineligible_session_not_computed(self):
+        """Without debug logging, an ineligible session's idletime is unused"""
+
+        stop_idle_sessions.main.logger.setLevel(logging.INFO)
+        stop_idle_sessions.main.main()
+
+        self._mocked_compute_idleness_metric.assert_not_called()
+
+    def test_ineligible_session_computed_for_debug(self):
+        """With debug logging, an ineligible session's idletime is reported"""
+
+        stop_idle_sessions.main.logger.setLevel(logging.DEBUG)
+        with self.assertLogs('stop_idle_sessions.main', level='DEBUG') as logs:
+            stop_idle_sessions.main.main()
+
+        self._mocked_compute_idleness_metric.assert_called_once()
+        self.assertEqual(logs.output, [
+                'DEBUG:stop_idle_sessions.main:Skipping graphical session '
+                'session id="A" leader=100 user=auser@notty (w/ 0 processes) '
+                '-- idle for 60.0 minutes'
+        ])
+
+    def test_username_cache_reset_per_run(self):
+        """A UID which failed to resolve in an earlier run is looked up again"""
+
+        cached_uids: List[Dict[int, Optional[str]]] = []
+
+        def recording_load_sessions():
+            cached_uids.append(dict(stop_idle_sessions.main._UID_USERNAME_CACHE))
+            return [self._session]
+
+        stop_idle_sessions.main.load_sessions.side_effect = recording_load_sessions
+
+        with patch.dict('stop_idle_sessions.main._UID_USERNAME_CACHE',
+                        {1000: None}):
+            stop_idle_sessions.main.main()
+
+        self.assertEqual(cached_uids, [{}])
+
+
+def load_tests(loader, *_):
     """Implementation of the load_tests protocol
 
     https://docs.python.org/3/library/unittest.html#load-tests-protocol
 
-    All of the test cases should be added by the test_scenario*.py files. No
-    unit tests should be run directly from this common file.
+    The MainLoopTestCase should be added by the test_scenario*.py files, so
+    it is not run directly from this common file. Only the standalone test
+    cases defined here are collected.
 
-    We ignore the 1st argument (loader), 2nd argument (standard_tests), and
-    3rd argument (pattern) and substitute a totally custom (empty) TestSuite.
+    We ignore the 2nd argument (standard_tests) and 3rd argument (pattern)
+    and substitute a custom TestSuite.
     """
-    return TestSuite()
+    suite = TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TunneledSessionsTestCase))
+    suite.addTests(loader.loadTestsFromTestCase(LoadConfigTestCase))
+    suite.addTests(loader.loadTestsFromTestCase(SkipIneligibleSessionTestCase))
+    return suite
@@ -1,6 +1,8 @@
 """Common process table / cgroup testing logic shared across all scenarios"""
 
 
+import functools
+from types import MappingProxyType, SimpleNamespace
 from typing import List, Mapping
 from unittest import TestCase, TestSuite
 from unittest.mock import Mock, mock_open, patch
@@ -67,12 +69,16 @@ class CgroupPidsTestCase(TestCase):
 
         self._mocked_processes = {}
 
+        # Only the psutil.Process constructor needs to record its calls. Each
+        # process it "returns" is just a read-only bag of attributes, so a
+        # SimpleNamespace stands in for it at a fraction of the Mock overhead.
         self._mocked_psutil_process = Mock(side_effect=self._psutil_process_init)
         for pid, cmdline in process_specs.items():
-            self._mocked_processes[pid] = Mock()
-            self._mocked_processes[pid].pid = pid
-            self._mocked_processes[pid].cmdline = Mock(return_value=cmdline.split())
-            self._mocked_processes[pid].environ = Mock(return_value={})
+            self._mocked_processes[pid] = SimpleNamespace(
+                    pid=pid,
+                    cmdline=functools.partial(list, cmdline.split()),
+                    environ=dict
+            )
 
         self._mocked_open = mock_open(read_data=self._cgroup_procs_content)
 
@@ -87,7 +93,7 @@ class CgroupPidsTestCase(TestCase):
         return "".join(map(lambda x: f"{x}\n",
                            sorted(self._mocked_processes.keys())))
 
-    def _psutil_process_init(self, *args, **_) -> Mock:
+    def _psutil_process_init(self, *args, **_) -> SimpleNamespace:
         """Mock the initialization of a Process by looking up a PID"""
         return self._mocked_processes[int(args[0])]
 
@@ -99,12 +105,27 @@ class CgroupPidsTestCase(TestCase):
     _mocked_psutil_process: Mock
 
     # Individually-mocked Process objects which have been cached
-    _mocked_processes: Mapping[int, Mock]
+    _mocked_processes: Mapping[int, SimpleNamespace]
 
     # A mocked variant of the builtin open() function
     _mocked_open: Mock
 
 
+# Shared read-only environment for any fixture Process which doesn't have one
+EMPTY_ENVIRON: Mapping[str, str] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=None)
+def stub_process(pid: int) -> stop_idle_sessions.ps.Process:
+    """Shared placeholder Process with an empty cmdline and environment
+
+    Many scenario fixtures only care about process identity (Process equality
+    is by PID), so they can all share one immutable stub per PID instead of
+    constructing a fresh Process at every use.
+    """
+    return stop_idle_sessions.ps.Process(pid, "", EMPTY_ENVIRON)
+
+
 def load_tests(*_):
     """Implementation of the load_tests protocol
 
@@ -11,10 +11,11 @@ and there is an idle GDM session running.
 
 
 import datetime
-from ipaddress import ip_address, IPv4Address, IPv6Address
-from textwrap import dedent
-from typing import Any, List, Mapping, Optional, Set, Tuple, Union
-from unittest.mock import MagicMock, Mock
+from ipaddress import IPv4Address, IPv6Address
+from types import MappingProxyType
+from typing import (AbstractSet, Any, FrozenSet, List, Mapping, Optional, Tuple,
+                    Union)
+from unittest.mock import Mock
 
 import stop_idle_sessions.logind
 import stop_idle_sessions.main
@@ -25,6 +26,76 @@ import stop_idle_sessions.tty
 from . import test_logind, test_main, test_ps, test_ss
 
 
+# Input data to populate the mock Gio object (logind API), and the expected
+# set of logind session attributes to be returned. These are read-only and
+# only built once.
+_GIO_RESULTS_SPEC: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "1267": MappingProxyType({
+        "Id": "1267",
+        "User": "1002",
+        "TTY": "pts/2",
+        "Scope": "session-1267.scope",
+        "Leader": "952165"
+    }),
+    "1301": MappingProxyType({
+        "Id": "1301",
+        "User": "0",
+        "TTY": "pts/1",
+        "Scope": "session-1301.scope",
+        "Leader": "994974"
+    }),
+    "1337": MappingProxyType({
+        "Id": "1337",
+        "User": "1002",
+        "TTY": "pts/0",
+        "Scope": "session-1337.scope",
+        "Leader": "1050298"
+    }),
+    "c1": MappingProxyType({
+        "Id": "c1",
+        "User": "42",
+        "TTY": "tty1",
+        "Scope": "session-c1.scope",
+        "Leader": "5655"
+    })
+})
+
+_EXPECTED_LOGIND_SESSIONS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "session_id": "1267",
+        "uid": 1002,
+        "tty": "pts/2",
+        "leader": 952165,
+        "scope": "session-1267.scope",
+        "scope_path": "/user.slice/user-1002.slice/session-1267.scope"
+    }),
+    MappingProxyType({
+        "session_id": "1301",
+        "uid": 0,
+        "tty": "pts/1",
+        "leader": 994974,
+        "scope": "session-1301.scope",
+        "scope_path": "/user.slice/user-0.slice/session-1301.scope"
+    }),
+    MappingProxyType({
+        "session_id": "1337",
+        "uid": 1002,
+        "tty": "pts/0",
+        "leader": 1050298,
+        "scope": "session-1337.scope",
+        "scope_path": "/user.slice/user-1002.slice/session-1337.scope"
+    }),
+    MappingProxyType({
+        "session_id": "c1",
+        "uid": 42,
+        "tty": "tty1",
+        "leader": 5655,
+        "scope": "session-c1.scope",
+        "scope_path": "/user.slice/user-42.slice/session-c1.scope"
+    })
+)
+
+
 class Scenario1LogindTestCase(test_logind.LogindTestCase):
     """Scenario1 unit testing for the logind module
 
@@ -38,73 +109,103 @@ class Scenario1LogindTestCase(test_logind.LogindTestCase):
 
     def _mock_gio_results_spec(self) -> Mapping[str, Mapping[str, str]]:
         """Input data to populate the mock Gio object (logind API)"""
-        return {
-            "1267": {
-                "Id": "1267",
-                "User": "1002",
-                "TTY": "pts/2",
-                "Scope": "session-1267.scope",
-                "Leader": "952165"
-            },
-            "1301": {
-                "Id": "1301",
-                "User": "0",
-                "TTY": "pts/1",
-                "Scope": "session-1301.scope",
-                "Leader": "994974"
-            },
-            "1337": {
-                "Id": "1337",
-                "User": "1002",
-                "TTY": "pts/0",
-                "Scope": "session-1337.scope",
-                "Leader": "1050298"
-            },
-            "c1": {
-                "Id": "c1",
-                "User": "42",
-                "TTY": "tty1",
-                "Scope": "session-c1.scope",
-                "Leader": "5655"
-            }
-        }
+        return _GIO_RESULTS_SPEC
 
     def _expected_logind_sessions(self) -> List[Mapping[str, Any]]:
         """Expected set of logind session attributes to be returned"""
-        return [
-            {
-                "session_id": "1267",
-                "uid": 1002,
-                "tty": "pts/2",
-                "leader": 952165,
-                "scope": "session-1267.scope",
-                "scope_path": "/user.slice/user-1002.slice/session-1267.scope"
-            },
-            {
-                "session_id": "1301",
-                "uid": 0,
-                "tty": "pts/1",
-                "leader": 994974,
-                "scope": "session-1301.scope",
-                "scope_path": "/user.slice/user-0.slice/session-1301.scope"
-            },
-            {
-                "session_id": "1337",
-                "uid": 1002,
-                "tty": "pts/0",
-                "leader": 1050298,
-                "scope": "session-1337.scope",
-                "scope_path": "/user.slice/user-1002.slice/session-1337.scope"
-            },
-            {
-                "session_id": "c1",
-                "uid": 42,
-                "tty": "tty1",
-                "leader": 5655,
-                "scope": "session-c1.scope",
-                "scope_path": "/user.slice/user-42.slice/session-c1.scope"
-            }
-        ]
+        return list(_EXPECTED_LOGIND_SESSIONS)
+
+
+# Input data to populate the filesystem mock for the cgroup sysfs, and the
+# expected set of processes to be parsed out of it. These are only built once,
+# rather than every time a Scenario1CgroupPidsTestCase method asks for them.
+# The expected processes are derived from the very same rows, because the
+# mocked psutil reports exactly these PIDs and command lines (and an empty
+# environment for each).
+# Yes, there are some very long lines here!
+# pylint: disable=line-too-long
+# Most of the session's helper processes live under this common prefix
+_LIBEXEC = "/usr/libexec/"
+
+# The VNC server and its startup script are also referenced by the main loop
+# fixture below, so their command lines are only spelled out once
+_XVNC_CMDLINE = ("/usr/bin/Xvnc :1 -auth /u/wk/auser/.Xauthority "
+                 "-desktop computer:1 (auser) -fp "
+                 "catalogue:/etc/X11/fontpath.d -geometry "
+                 "1024x768 -pn -rfbauth /u/wk/auser/.vnc/passwd "
+                 "-rfbport 5901 -localhost")
+_XSTARTUP_CMDLINE = "/bin/sh /u/wk/auser/.vnc/xstartup"
+
+_PROCESS_ROWS: Tuple[Tuple[int, str], ...] = (
+    (772211, _LIBEXEC + "gvfsd-metadata"),
+    (952570, _XVNC_CMDLINE),
+    (952581, _XSTARTUP_CMDLINE),
+    (952582, _LIBEXEC + "gnome-session-binary"),
+    (952591, "dbus-launch --sh-syntax --exit-with-session"),
+    (952592, "/usr/bin/dbus-daemon --syslog --fork --print-pid 5 --print-address 7 --session"),
+    (952644, _LIBEXEC + "at-spi-bus-launcher"),
+    (952649, "/usr/bin/dbus-daemon --config-file=/usr/share/defaults/at-spi2/accessibility.conf --nofork --print-address 3"),
+    (952652, _LIBEXEC + "at-spi2-registryd --use-gnome-session"),
+    (952656, _LIBEXEC + "gvfsd"),
+    (952663, _LIBEXEC + "gvfsd-fuse /run/user/1002/gvfs -f -o big_writes"),
+    (952715, "/usr/bin/gnome-keyring-daemon --start --components=pkcs11"),
+    (952727, "/usr/bin/gnome-shell"),
+    (952766, "ibus-daemon --xim --panel disable"),
+    (952768, _LIBEXEC + "xdg-permission-store"),
+    (952770, _LIBEXEC + "gnome-shell-calendar-server"),
+    (952774, _LIBEXEC + "ibus-dconf"),
+    (952775, _LIBEXEC + "ibus-extension-gtk3"),
+    (952777, _LIBEXEC + "ibus-x11 --kill-daemon"),
+    (952779, _LIBEXEC + "ibus-portal"),
+    (952805, _LIBEXEC + "evolution-source-registry"),
+    (952817, _LIBEXEC + "goa-daemon"),
+    (952819, _LIBEXEC + "dconf-service"),
+    (952837, _LIBEXEC + "goa-identity-service"),
+    (952841, _LIBEXEC + "gvfs-udisks2-volume-monitor"),
+    (952853, _LIBEXEC + "gvfs-mtp-volume-monitor"),
+    (952861, _LIBEXEC + "gvfs-goa-volume-monitor"),
+    (952868, _LIBEXEC + "gvfs-gphoto2-volume-monitor"),
+    (952875, _LIBEXEC + "gvfs-afc-volume-monitor"),
+    (952885, _LIBEXEC + "gsd-power"),
+    (952888, _LIBEXEC + "gsd-print-notifications"),
+    (952889, _LIBEXEC + "gsd-rfkill"),
+    (952890, _LIBEXEC + "gsd-screensaver-proxy"),
+    (952891, _LIBEXEC + "gsd-sharing"),
+    (952892, _LIBEXEC + "gsd-smartcard"),
+    (952893, _LIBEXEC + "gsd-sound"),
+    (952894, _LIBEXEC + "gsd-xsettings"),
+    (952895, _LIBEXEC + "gsd-subman"),
+    (952898, _LIBEXEC + "gsd-wacom"),
+    (952904, _LIBEXEC + "gsd-account"),
+    (952905, _LIBEXEC + "gsd-clipboard"),
+    (952907, _LIBEXEC + "gsd-a11y-settings"),
+    (952909, _LIBEXEC + "gsd-datetime"),
+    (952910, _LIBEXEC + "evolution-calendar-factory"),
+    (952911, _LIBEXEC + "gsd-color"),
+    (952913, _LIBEXEC + "gsd-keyboard"),
+    (952919, _LIBEXEC + "gsd-housekeeping"),
+    (952921, _LIBEXEC + "gsd-mouse"),
+    (952935, _LIBEXEC + "gsd-media-keys"),
+    (952941, _LIBEXEC + "ibus-engine-simple"),
+    (952959, _LIBEXEC + "gsd-printer"),
+    (953009, _LIBEXEC + "evolution-calendar-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.Calendarx952910x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/Calendar/952910/2"),
+    (953028, _LIBEXEC + "evolution-addressbook-factory"),
+    (953050, _LIBEXEC + "evolution-addressbook-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.AddressBookx953028x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/AddressBook/953028/2"),
+    (953201, _LIBEXEC + "gsd-disk-utility-notify"),
+    (953207, "/usr/bin/gnome-software --gapplication-service"),
+    (953209, _LIBEXEC + "evolution/evolution-alarm-notify"),
+    (953210, _LIBEXEC + "tracker-miner-fs"),
+    (953212, _LIBEXEC + "tracker-miner-apps"),
+    (953217, _LIBEXEC + "tracker-store")
+)
+
+_PROCESS_SPECS: Mapping[int, str] = MappingProxyType(dict(_PROCESS_ROWS))
+
+_EXPECTED_PROCESSES: Tuple[stop_idle_sessions.ps.Process, ...] = tuple(
+    stop_idle_sessions.ps.Process(pid, cmdline, test_ps.EMPTY_ENVIRON)
+    for pid, cmdline in _PROCESS_ROWS
+)
+# pylint: enable=line-too-long
 
 
 class Scenario1CgroupPidsTestCase(test_ps.CgroupPidsTestCase):
@@ -124,493 +225,84 @@ class Scenario1CgroupPidsTestCase(test_ps.CgroupPidsTestCase):
 
     def _mock_process_specs(self) -> Mapping[int, str]:
         """Input data to populate the filesystem mock for the cgroup sysfs"""
-        # Yes, there are some very long lines here!
-        # pylint: disable=line-too-long
-        return {
-            772211: "/usr/libexec/gvfsd-metadata",
-            952570: "/usr/bin/Xvnc :1 -auth /u/wk/auser/.Xauthority -desktop computer:1 (auser) -fp catalogue:/etc/X11/fontpath.d -geometry 1024x768 -pn -rfbauth /u/wk/auser/.vnc/passwd -rfbport 5901 -localhost",
-            952581: "/bin/sh /u/wk/auser/.vnc/xstartup",
-            952582: "/usr/libexec/gnome-session-binary",
-            952591: "dbus-launch --sh-syntax --exit-with-session",
-            952592: "/usr/bin/dbus-daemon --syslog --fork --print-pid 5 --print-address 7 --session",
-            952644: "/usr/libexec/at-spi-bus-launcher",
-            952649: "/usr/bin/dbus-daemon --config-file=/usr/share/defaults/at-spi2/accessibility.conf --nofork --print-address 3",
-            952652: "/usr/libexec/at-spi2-registryd --use-gnome-session",
-            952656: "/usr/libexec/gvfsd",
-            952663: "/usr/libexec/gvfsd-fuse /run/user/1002/gvfs -f -o big_writes",
-            952715: "/usr/bin/gnome-keyring-daemon --start --components=pkcs11",
-            952727: "/usr/bin/gnome-shell",
-            952766: "ibus-daemon --xim --panel disable",
-            952768: "/usr/libexec/xdg-permission-store",
-            952770: "/usr/libexec/gnome-shell-calendar-server",
-            952774: "/usr/libexec/ibus-dconf",
-            952775: "/usr/libexec/ibus-extension-gtk3",
-            952777: "/usr/libexec/ibus-x11 --kill-daemon",
-            952779: "/usr/libexec/ibus-portal",
-            952805: "/usr/libexec/evolution-source-registry",
-            952817: "/usr/libexec/goa-daemon",
-            952819: "/usr/libexec/dconf-service",
-            952837: "/usr/libexec/goa-identity-service",
-            952841: "/usr/libexec/gvfs-udisks2-volume-monitor",
-            952853: "/usr/libexec/gvfs-mtp-volume-monitor",
-            952861: "/usr/libexec/gvfs-goa-volume-monitor",
-            952868: "/usr/libexec/gvfs-gphoto2-volume-monitor",
-            952875: "/usr/libexec/gvfs-afc-volume-monitor",
-            952885: "/usr/libexec/gsd-power",
-            952888: "/usr/libexec/gsd-print-notifications",
-            952889: "/usr/libexec/gsd-rfkill",
-            952890: "/usr/libexec/gsd-screensaver-proxy",
-            952891: "/usr/libexec/gsd-sharing",
-            952892: "/usr/libexec/gsd-smartcard",
-            952893: "/usr/libexec/gsd-sound",
-            952894: "/usr/libexec/gsd-xsettings",
-            952895: "/usr/libexec/gsd-subman",
-            952898: "/usr/libexec/gsd-wacom",
-            952904: "/usr/libexec/gsd-account",
-            952905: "/usr/libexec/gsd-clipboard",
-            952907: "/usr/libexec/gsd-a11y-settings",
-            952909: "/usr/libexec/gsd-datetime",
-            952910: "/usr/libexec/evolution-calendar-factory",
-            952911: "/usr/libexec/gsd-color",
-            952913: "/usr/libexec/gsd-keyboard",
-            952919: "/usr/libexec/gsd-housekeeping",
-            952921: "/usr/libexec/gsd-mouse",
-            952935: "/usr/libexec/gsd-media-keys",
-            952941: "/usr/libexec/ibus-engine-simple",
-            952959: "/usr/libexec/gsd-printer",
-            953009: "/usr/libexec/evolution-calendar-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.Calendarx952910x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/Calendar/952910/2",
-            953028: "/usr/libexec/evolution-addressbook-factory",
-            953050: "/usr/libexec/evolution-addressbook-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.AddressBookx953028x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/AddressBook/953028/2",
-            953201: "/usr/libexec/gsd-disk-utility-notify",
-            953207: "/usr/bin/gnome-software --gapplication-service",
-            953209: "/usr/libexec/evolution/evolution-alarm-notify",
-            953210: "/usr/libexec/tracker-miner-fs",
-            953212: "/usr/libexec/tracker-miner-apps",
-            953217: "/usr/libexec/tracker-store"
-        }
+        return _PROCESS_SPECS
 
     def _expected_process_objects(self) -> List[stop_idle_sessions.ps.Process]:
         """Expected set of processes to be parsed out of the cgroup sysfs"""
-        # Yes, there are some very long lines here!
-        # pylint: disable=line-too-long
-        return [
-            stop_idle_sessions.ps.Process(
-                    pid=772211,
-                    cmdline="/usr/libexec/gvfsd-metadata",
-                    environ={}
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952570,
-                    cmdline="/usr/bin/Xvnc :1 -auth /u/wk/auser/.Xauthority -desktop computer:1 (auser) -fp catalogue:/etc/X11/fontpath.d -geometry 1024x768 -pn -rfbauth /u/wk/auser/.vnc/passwd -rfbport 5901 -localhost",
-                    environ={}
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952581,
-                    cmdline="/bin/sh /u/wk/auser/.vnc/xstartup",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952582,
-                    cmdline="/usr/libexec/gnome-session-binary",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952591,
-                    cmdline="dbus-launch --sh-syntax --exit-with-session",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952592,
-                    cmdline="/usr/bin/dbus-daemon --syslog --fork --print-pid 5 --print-address 7 --session",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952644,
-                    cmdline="/usr/libexec/at-spi-bus-launcher",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952649,
-                    cmdline="/usr/bin/dbus-daemon --config-file=/usr/share/defaults/at-spi2/accessibility.conf --nofork --print-address 3",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952652,
-                    cmdline="/usr/libexec/at-spi2-registryd --use-gnome-session",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952656,
-                    cmdline="/usr/libexec/gvfsd",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952663,
-                    cmdline="/usr/libexec/gvfsd-fuse /run/user/1002/gvfs -f -o big_writes",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952715,
-                    cmdline="/usr/bin/gnome-keyring-daemon --start --components=pkcs11",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952727,
-                    cmdline="/usr/bin/gnome-shell",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952766,
-                    cmdline="ibus-daemon --xim --panel disable",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952768,
-                    cmdline="/usr/libexec/xdg-permission-store",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952770,
-                    cmdline="/usr/libexec/gnome-shell-calendar-server",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952774,
-                    cmdline="/usr/libexec/ibus-dconf",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952775,
-                    cmdline="/usr/libexec/ibus-extension-gtk3",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952777,
-                    cmdline="/usr/libexec/ibus-x11 --kill-daemon",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952779,
-                    cmdline="/usr/libexec/ibus-portal",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952805,
-                    cmdline="/usr/libexec/evolution-source-registry",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952817,
-                    cmdline="/usr/libexec/goa-daemon",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952819,
-                    cmdline="/usr/libexec/dconf-service",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952837,
-                    cmdline="/usr/libexec/goa-identity-service",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952841,
-                    cmdline="/usr/libexec/gvfs-udisks2-volume-monitor",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952853,
-                    cmdline="/usr/libexec/gvfs-mtp-volume-monitor",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952861,
-                    cmdline="/usr/libexec/gvfs-goa-volume-monitor",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952868,
-                    cmdline="/usr/libexec/gvfs-gphoto2-volume-monitor",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952875,
-                    cmdline="/usr/libexec/gvfs-afc-volume-monitor",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952885,
-                    cmdline="/usr/libexec/gsd-power",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952888,
-                    cmdline="/usr/libexec/gsd-print-notifications",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
+        return list(_EXPECTED_PROCESSES)
+
+
+# Input data to populate the mocked network connections table, exactly as
+# printed by ss (including its trailing whitespace padding).
+# pylint: disable=line-too-long
+_RAW_SS_OUTPUT = (
+    'LISTEN    0      100         127.0.0.1:25           0.0.0.0:*     users:(("master",pid=5337,fd=14))                          \n'
+    'LISTEN    0      5           127.0.0.1:5901         0.0.0.0:*     users:(("Xvnc",pid=952570,fd=6))                           \n'
+    'LISTEN    0      128           0.0.0.0:111          0.0.0.0:*     users:(("rpcbind",pid=4410,fd=4),("systemd",pid=1,fd=42))  \n'
+    'LISTEN    0      128           0.0.0.0:22           0.0.0.0:*     users:(("sshd",pid=4960,fd=3))                             \n'
+    'LISTEN    0      2048        127.0.0.1:631          0.0.0.0:*     users:(("cupsd",pid=162159,fd=8))                          \n'
+    'ESTAB     0      452        10.0.0.169:22        10.0.3.209:57343 users:(("sshd",pid=1256518,fd=4),("sshd",pid=1256491,fd=4))\n'
+    'SYN-SENT  0      1          10.0.0.169:45198 151.101.193.91:443   users:(("gnome-software",pid=1259638,fd=22))               \n'
+    'TIME-WAIT 0      0          10.0.0.169:41180     10.0.4.244:636                                                              \n'
+    'TIME-WAIT 0      0          10.0.0.169:53546     10.0.2.100:3128                                                             \n'
+    'ESTAB     0      0           127.0.0.1:5901       127.0.0.1:49688 users:(("Xvnc",pid=952570,fd=23))                          \n'
+    'SYN-SENT  0      1          10.0.0.169:40676 151.101.129.91:443   users:(("gnome-shell",pid=1259171,fd=34))                  \n'
+    'ESTAB     0      0          10.0.0.169:22         10.0.1.53:41516 users:(("sshd",pid=1259753,fd=4),("sshd",pid=1259733,fd=4))\n'
+    'ESTAB     0      0           127.0.0.1:49688      127.0.0.1:5901  users:(("sshd",pid=1256518,fd=7))                          \n'
+    'ESTAB     0      0          10.0.0.169:22         10.0.1.53:39700 users:(("sshd",pid=1050325,fd=4),("sshd",pid=1050298,fd=4))\n'
+    'TIME-WAIT 0      0          10.0.0.169:41178     10.0.4.244:636                                                              \n'
+    'ESTAB     0      0          10.0.0.169:725       10.0.1.202:2049                                                             \n'
+    'TIME-WAIT 0      0          10.0.0.169:53532     10.0.2.100:3128                                                             \n'
+    'ESTAB     0      0          10.0.0.169:22         10.0.1.53:54592 users:(("sshd",pid=995013,fd=4),("sshd",pid=994974,fd=4))  \n'
+    'TIME-WAIT 0      0          10.0.0.169:41196     10.0.4.244:636                                                              \n'
+    'TIME-WAIT 0      0          10.0.0.169:41176     10.0.4.244:636                                                              \n'
+    'SYN-SENT  0      1          10.0.0.169:49948 151.101.193.91:443   users:(("gnome-shell",pid=6978,fd=32))                     \n'
+    'ESTAB     0      612        10.0.0.169:22        10.0.3.209:57353 users:(("sshd",pid=1258236,fd=4),("sshd",pid=1258006,fd=4))\n'
+    'TIME-WAIT 0      0          10.0.0.169:53550     10.0.2.100:3128                                                             \n'
+    'ESTAB     0      0          10.0.0.169:861       10.0.1.203:2049                                                             \n'
+    'LISTEN    0      100             [::1]:25              [::]:*     users:(("master",pid=5337,fd=15))                          \n'
+    'LISTEN    0      5               [::1]:5901            [::]:*     users:(("Xvnc",pid=952570,fd=7))                           \n'
+    'LISTEN    0      128              [::]:111             [::]:*     users:(("rpcbind",pid=4410,fd=6),("systemd",pid=1,fd=44))  \n'
+    'LISTEN    0      2048            [::1]:631             [::]:*     users:(("cupsd",pid=162159,fd=7))                          \n'
+)
+# pylint: enable=line-too-long
+
+# Expected set of listening ports parsed out of the mock ss data
+_EXPECTED_LISTENING_PORTS: FrozenSet[int] = frozenset((22, 25, 111, 631, 5901))
+
+# Expected set of remote peers parsed from the established conns
+_EXPECTED_PEER_PAIRS: FrozenSet[Tuple[Union[IPv4Address, IPv6Address],
+                                      int]] = frozenset([
+        (IPv4Address('10.0.1.53'), 39700),
+        (IPv4Address('10.0.1.53'), 41516),
+        (IPv4Address('10.0.1.53'), 54592),
+        (IPv4Address('10.0.1.202'), 2049),
+        (IPv4Address('10.0.1.203'), 2049),
+        (IPv4Address('10.0.3.209'), 57343),
+        (IPv4Address('10.0.3.209'), 57353),
+        (IPv4Address('127.0.0.1'), 5901),
+        (IPv4Address('127.0.0.1'), 49688)
+])
+
+
+# The loopback connections which are identified from the mock ss data. This is
+# both the expected result of parsing _RAW_SS_OUTPUT and the input to the main
+# loop (standing in for ss.find_loopback_connections), so that the two fixtures
+# are always derived from one definition. The whole graph is only built once.
+_LOOPBACK_CONNECTIONS: Tuple[stop_idle_sessions.ss.LoopbackConnection, ...] = (
+    stop_idle_sessions.ss.LoopbackConnection(
+            client=stop_idle_sessions.ss.Socket(
+                addr=IPv4Address('127.0.0.1'),
+                port=49688,
+                processes=[test_ps.stub_process(1256518)]
             ),
-            stop_idle_sessions.ps.Process(
-                    pid=952889,
-                    cmdline="/usr/libexec/gsd-rfkill",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952890,
-                    cmdline="/usr/libexec/gsd-screensaver-proxy",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952891,
-                    cmdline="/usr/libexec/gsd-sharing",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952892,
-                    cmdline="/usr/libexec/gsd-smartcard",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952893,
-                    cmdline="/usr/libexec/gsd-sound",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952894,
-                    cmdline="/usr/libexec/gsd-xsettings",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952895,
-                    cmdline="/usr/libexec/gsd-subman",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952898,
-                    cmdline="/usr/libexec/gsd-wacom",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952904,
-                    cmdline="/usr/libexec/gsd-account",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952905,
-                    cmdline="/usr/libexec/gsd-clipboard",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952907,
-                    cmdline="/usr/libexec/gsd-a11y-settings",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952909,
-                    cmdline="/usr/libexec/gsd-datetime",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952910,
-                    cmdline="/usr/libexec/evolution-calendar-factory",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952911,
-                    cmdline="/usr/libexec/gsd-color",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952913,
-                    cmdline="/usr/libexec/gsd-keyboard",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952919,
-                    cmdline="/usr/libexec/gsd-housekeeping",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952921,
-                    cmdline="/usr/libexec/gsd-mouse",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952935,
-                    cmdline="/usr/libexec/gsd-media-keys",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952941,
-                    cmdline="/usr/libexec/ibus-engine-simple",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=952959,
-                    cmdline="/usr/libexec/gsd-printer",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953009,
-                    cmdline="/usr/libexec/evolution-calendar-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.Calendarx952910x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/Calendar/952910/2",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953028,
-                    cmdline="/usr/libexec/evolution-addressbook-factory",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953050,
-                    cmdline="/usr/libexec/evolution-addressbook-factory-subprocess --factory all --bus-name org.gnome.evolution.dataserver.Subprocess.Backend.AddressBookx953028x2 --own-path /org/gnome/evolution/dataserver/Subprocess/Backend/AddressBook/953028/2",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953201,
-                    cmdline="/usr/libexec/gsd-disk-utility-notify",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953207,
-                    cmdline="/usr/bin/gnome-software --gapplication-service",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953209,
-                    cmdline="/usr/libexec/evolution/evolution-alarm-notify",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953210,
-                    cmdline="/usr/libexec/tracker-miner-fs",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953212,
-                    cmdline="/usr/libexec/tracker-miner-apps",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
-            ),
-            stop_idle_sessions.ps.Process(
-                    pid=953217,
-                    cmdline="/usr/libexec/tracker-store",
-                    environ={
-                        'DISPLAY': ':1'
-                    }
+            server=stop_idle_sessions.ss.Socket(
+                addr=IPv4Address('127.0.0.1'),
+                port=5901,
+                processes=[test_ps.stub_process(952570)]
             )
-        ]
+    ),
+)
 
 
 class Scenario1LoopbackConnectionTestCase(test_ss.LoopbackConnectionTestCase):
@@ -625,80 +317,20 @@ class Scenario1LoopbackConnectionTestCase(test_ss.LoopbackConnectionTestCase):
 
     def _mock_raw_ss_output(self) -> str:
         """Input data to populate the mocked network connections table"""
-        return dedent("""\
-            LISTEN    0      100         127.0.0.1:25           0.0.0.0:*     users:(("master",pid=5337,fd=14))                          
-            LISTEN    0      5           127.0.0.1:5901         0.0.0.0:*     users:(("Xvnc",pid=952570,fd=6))                           
-            LISTEN    0      128           0.0.0.0:111          0.0.0.0:*     users:(("rpcbind",pid=4410,fd=4),("systemd",pid=1,fd=42))  
-            LISTEN    0      128           0.0.0.0:22           0.0.0.0:*     users:(("sshd",pid=4960,fd=3))                             
-            LISTEN    0      2048        127.0.0.1:631          0.0.0.0:*     users:(("cupsd",pid=162159,fd=8))                          
-            ESTAB     0      452        10.0.0.169:22        10.0.3.209:57343 users:(("sshd",pid=1256518,fd=4),("sshd",pid=1256491,fd=4))
-            SYN-SENT  0      1          10.0.0.169:45198 151.101.193.91:443   users:(("gnome-software",pid=1259638,fd=22))               
-            TIME-WAIT 0      0          10.0.0.169:41180     10.0.4.244:636                                                              
-            TIME-WAIT 0      0          10.0.0.169:53546     10.0.2.100:3128                                                             
-            ESTAB     0      0           127.0.0.1:5901       127.0.0.1:49688 users:(("Xvnc",pid=952570,fd=23))                          
-            SYN-SENT  0      1          10.0.0.169:40676 151.101.129.91:443   users:(("gnome-shell",pid=1259171,fd=34))                  
-            ESTAB     0      0          10.0.0.169:22         10.0.1.53:41516 users:(("sshd",pid=1259753,fd=4),("sshd",pid=1259733,fd=4))
-            ESTAB     0      0           127.0.0.1:49688      127.0.0.1:5901  users:(("sshd",pid=1256518,fd=7))                          
-            ESTAB     0      0          10.0.0.169:22         10.0.1.53:39700 users:(("sshd",pid=1050325,fd=4),("sshd",pid=1050298,fd=4))
-            TIME-WAIT 0      0          10.0.0.169:41178     10.0.4.244:636                                                              
-            ESTAB     0      0          10.0.0.169:725       10.0.1.202:2049                                                             
-            TIME-WAIT 0      0          10.0.0.169:53532     10.0.2.100:3128                                                             
-            ESTAB     0      0          10.0.0.169:22         10.0.1.53:54592 users:(("sshd",pid=995013,fd=4),("sshd",pid=994974,fd=4))  
-            TIME-WAIT 0      0          10.0.0.169:41196     10.0.4.244:636                                                              
-            TIME-WAIT 0      0          10.0.0.169:41176     10.0.4.244:636                                                              
-            SYN-SENT  0      1          10.0.0.169:49948 151.101.193.91:443   users:(("gnome-shell",pid=6978,fd=32))                     
-            ESTAB     0      612        10.0.0.169:22        10.0.3.209:57353 users:(("sshd",pid=1258236,fd=4),("sshd",pid=1258006,fd=4))
-            TIME-WAIT 0      0          10.0.0.169:53550     10.0.2.100:3128                                                             
-            ESTAB     0      0          10.0.0.169:861       10.0.1.203:2049                                                             
-            LISTEN    0      100             [::1]:25              [::]:*     users:(("master",pid=5337,fd=15))                          
-            LISTEN    0      5               [::1]:5901            [::]:*     users:(("Xvnc",pid=952570,fd=7))                           
-            LISTEN    0      128              [::]:111             [::]:*     users:(("rpcbind",pid=4410,fd=6),("systemd",pid=1,fd=44))  
-            LISTEN    0      2048            [::1]:631             [::]:*     users:(("cupsd",pid=162159,fd=7))                          
-        """)
-
-    def _expected_listening_ports(self) -> Set[int]:
+        return _RAW_SS_OUTPUT
+
+    def _expected_listening_ports(self) -> AbstractSet[int]:
         """Expected set of listening ports parsed out of the mock ss data"""
-        return set([22, 25, 111, 631, 5901])
+        return _EXPECTED_LISTENING_PORTS
 
-    def _expected_peer_pairs(self) -> Set[Tuple[Union[IPv4Address,
-                                                      IPv6Address], int]]:
+    def _expected_peer_pairs(self) -> AbstractSet[Tuple[Union[IPv4Address,
+                                                              IPv6Address], int]]:
         """Expected set of remote peers parsed from the established conns"""
-        return set([
-                (ip_address('10.0.1.53'), 39700),
-                (ip_address('10.0.1.53'), 41516),
-                (ip_address('10.0.1.53'), 54592),
-                (ip_address('10.0.1.202'), 2049),
-                (ip_address('10.0.1.203'), 2049),
-                (ip_address('10.0.3.209'), 57343),
-                (ip_address('10.0.3.209'), 57353),
-                (ip_address('127.0.0.1'), 5901),
-                (ip_address('127.0.0.1'), 49688)
-        ])
+        return _EXPECTED_PEER_PAIRS
 
     def _expected_connections(self) -> List[stop_idle_sessions.ss.LoopbackConnection]:
         """Expected set of loopback connections identified from these conns"""
-        return [
-            stop_idle_sessions.ss.LoopbackConnection(
-                    client=stop_idle_sessions.ss.Socket(
-                        addr=ip_address('127.0.0.1'),
-                        port=49688,
-                        processes=[stop_idle_sessions.ps.Process(
-                            pid=1256518,
-                            cmdline="",
-                            environ={}
-                        )]
-                    ),
-                    server=stop_idle_sessions.ss.Socket(
-                        addr=ip_address('127.0.0.1'),
-                        port=5901,
-                        processes=[stop_idle_sessions.ps.Process(
-                            pid=952570,
-                            cmdline="",
-                            environ={}
-                        )]
-                    )
-            )
-        ]
+        return list(_LOOPBACK_CONNECTIONS)
 
 
 class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
@@ -750,37 +382,14 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
 
     def _mock_find_loopback_connections(self) -> List[stop_idle_sessions.ss.LoopbackConnection]:
         """Input data to mock out the ss utility and module"""
-        return [
-            stop_idle_sessions.ss.LoopbackConnection(
-                client=stop_idle_sessions.ss.Socket(
-                    addr=ip_address('127.0.0.1'),
-                    port=49688,
-                    processes=[stop_idle_sessions.ps.Process(
-                        pid=1256518,
-                        cmdline="",
-                        environ={})
-                    ]
-                ),
-                server=stop_idle_sessions.ss.Socket(
-                    addr=ip_address('127.0.0.1'),
-                    port=5901,
-                    processes=[stop_idle_sessions.ps.Process(
-                        pid=952570,
-                        cmdline="",
-                        environ={})
-                    ]
-                )
-            )
-        ]
+        return list(_LOOPBACK_CONNECTIONS)
 
     def _mock_processes_in_scope_path(self,
                                       scope_path: str) -> List[stop_idle_sessions.ps.Process]:
         """Input data to mock out the ps and cgroup interface module"""
 
         if scope_path == "/user.slice/user-1002.slice/session-1267.scope":
-            pids = list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            pids = list(map(test_ps.stub_process,
                             [772211, 952582, 952591, 952592, 952644, 952649,
                              952652, 952656, 952663, 952715, 952727, 952766,
                              952768, 952770, 952774, 952775, 952777, 952779,
@@ -794,25 +403,19 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
 
             pids.append(stop_idle_sessions.ps.Process(
                     pid=952570,
-                    cmdline=("/usr/bin/Xvnc :1 -auth /u/wk/auser/.Xauthority "
-                             "-desktop computer:1 (auser) -fp "
-                             "catalogue:/etc/X11/fontpath.d -geometry "
-                             "1024x768 -pn -rfbauth /u/wk/auser/.vnc/passwd "
-                             "-rfbport 5901 -localhost"),
-                    environ={}
+                    cmdline=_XVNC_CMDLINE,
+                    environ=test_ps.EMPTY_ENVIRON
             ))
             pids.append(stop_idle_sessions.ps.Process(
                     pid=952581,
-                    cmdline="/bin/sh /u/wk/auser/.vnc/xstartup",
+                    cmdline=_XSTARTUP_CMDLINE,
                     environ={'DISPLAY': ":1"}
             ))
 
             return pids
 
         if scope_path == "/user.slice/user-0.slice/session-1301.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [1258996, 1259009, 1259010, 1259026, 1259028,
                              1259067, 1259083, 1259088, 1259093, 1259097,
                              1259105, 1259157, 1259171, 1259210, 1259212,
@@ -827,15 +430,11 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
                              1259632, 1259638, 1259640]))
 
         if scope_path == "/user.slice/user-1002.slice/session-1337.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [1050298, 1256518, 1256520]))
 
         if scope_path == "/user.slice/user-42.slice/session-c1.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [5655, 5875, 5877, 6221, 6243, 6263, 6544, 6604,
                              6620, 6978, 9150, 9273, 9279, 9283, 9670, 10363,
                              10375, 10377, 10383, 10396, 10418, 10422, 10426,
@@ -939,363 +538,243 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=datetime.timedelta(seconds=35),
                 username='auser',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=772211,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(772211),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952570,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952570),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952581,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952581),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952582,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952582),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952591,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952591),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952592,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952592),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952644,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952644),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952649,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952649),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952652,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952652),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952656,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952656),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952663,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952663),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952715,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952715),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952727,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952727),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952766,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952766),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952768,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952768),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952770,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952770),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952774,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952774),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952775,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952775),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952777,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952777),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952779,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952779),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952805,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952805),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952817,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952817),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952819,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952819),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952837,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952837),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952841,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952841),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952853,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952853),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952861,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952861),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952868,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952868),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952875,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952875),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952885,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952885),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952888,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952888),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952889,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952889),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952890,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952890),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952891,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952891),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952892,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952892),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952893,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952893),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952894,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952894),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952895,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952895),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952898,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952898),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952904,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952904),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952905,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952905),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952907,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952907),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952909,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952909),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952910,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952910),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952911,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952911),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952913,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952913),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952919,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952919),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952921,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952921),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952935,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952935),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952941,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952941),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=952959,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(952959),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953009,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953009),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953028,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953028),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953050,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953050),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953201,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953201),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953207,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953207),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953209,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953209),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953210,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953210),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953212,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953212),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=953217,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(953217),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -1307,351 +786,235 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='root',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1258996,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1258996),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259009,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259009),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259010,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259010),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259026,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259026),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259028,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259028),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259067,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259067),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259083,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259083),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259088,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259088),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259093,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259093),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259097,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259097),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259105,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259105),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259157,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259157),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259171,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259171),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259210,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259210),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259212,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259212),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259214,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259214),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259218,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259218),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259219,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259219),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259221,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259221),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259223,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259223),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259235,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259235),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259257,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259257),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259268,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259268),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259271,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259271),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259280,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259280),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259285,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259285),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259290,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259290),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259297,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259297),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259305,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259305),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259307,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259307),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259308,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259308),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259309,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259309),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259310,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259310),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259311,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259311),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259312,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259312),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259313,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259313),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259314,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259314),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259315,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259315),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259321,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259321),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259322,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259322),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259325,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259325),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259328,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259328),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259329,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259329),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259331,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259331),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259337,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259337),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259342,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259342),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259343,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259343),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259347,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259347),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259349,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259349),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259350,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259350),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259366,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259366),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259438,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259438),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259452,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259452),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259454,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259454),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259473,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259473),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259632,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259632),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259638,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259638),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1259640,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1259640),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -1663,25 +1026,17 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='auser',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1050298,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1050298),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1256518,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1256518),
                                 tunneled_processes=[
-                                    stop_idle_sessions.ps.Process(pid=952570,
-                                                                  cmdline="",
-                                                                  environ={})
+                                    test_ps.stub_process(952570)
                                 ],
                                 tunneled_sessions=[session_1267]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1256520,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1256520),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -1693,201 +1048,135 @@ class Scenario1MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=datetime.timedelta(seconds=47 * 60),
                 username='gdm',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=5655,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(5655),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=5875,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(5875),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=5877,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(5877),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6221,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6221),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6243,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6243),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6263,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6263),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6544,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6544),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6604,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6604),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6620,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6620),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=6978,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(6978),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=9150,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(9150),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=9273,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(9273),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=9279,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(9279),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=9283,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(9283),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=9670,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(9670),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10363,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10363),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10375,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10375),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10377,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10377),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10383,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10383),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10396,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10396),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10418,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10418),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10422,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10422),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10426,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10426),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10443,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10443),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10448,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10448),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10474,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10474),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10483,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10483),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10484,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10484),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10492,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10492),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10493,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10493),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10494,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10494),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10495,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10495),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=10518,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(10518),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
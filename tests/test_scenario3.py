@@ -42,7 +42,8 @@ In Scenario 3, there are a large number of different sessions:
 import datetime
 from ipaddress import ip_address, IPv4Address, IPv6Address
 from textwrap import dedent
-from typing import Any, List, Mapping, Optional, Set, Tuple, Union
+from typing import (AbstractSet, Any, FrozenSet, List, Mapping, Optional, Tuple,
+                    Union)
 from unittest.mock import Mock
 
 import stop_idle_sessions.logind
@@ -350,631 +351,772 @@ class Scenario3CgroupPidsTestCase(test_ps.CgroupPidsTestCase):
             stop_idle_sessions.ps.Process(
                     pid=60750,
                     cmdline="/bin/sh /usr/bin/startx -- :1",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60770,
                     cmdline="xinit /etc/X11/xinit/xinitrc -- /usr/bin/X :1 -auth /home/auser/.serverauth.60750",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60771,
                     cmdline="/usr/libexec/Xorg :1 -auth /home/auser/.serverauth.60750",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60776,
                     cmdline="/usr/libexec/gnome-session-binary",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60792,
                     cmdline="dbus-launch --sh-syntax --exit-with-session",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60793,
                     cmdline="/usr/bin/dbus-daemon --syslog --fork --print-pid 5 --print-address 7 --session",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60808,
                     cmdline="/usr/bin/ssh-agent /etc/X11/xinit/Xclients",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60823,
                     cmdline="/usr/libexec/at-spi-bus-launcher",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60828,
                     cmdline="/usr/bin/dbus-daemon --config-file=/usr/share/defaults/at-spi2/accessibility.conf --nofork --pri",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60831,
                     cmdline="/usr/libexec/at-spi2-registryd --use-gnome-session",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60835,
                     cmdline="/usr/libexec/gvfsd",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60842,
                     cmdline="/usr/libexec/gvfsd-fuse /home/auser/.gvfs -f -o big_writes",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60870,
                     cmdline="/usr/bin/gnome-keyring-daemon --start --components=pkcs11",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60884,
                     cmdline="/usr/bin/gnome-shell",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60900,
                     cmdline="ibus-daemon --xim --panel disable",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60902,
                     cmdline="/usr/libexec/xdg-permission-store",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60904,
                     cmdline="/usr/libexec/gnome-shell-calendar-server",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60908,
                     cmdline="/usr/libexec/ibus-dconf",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60909,
                     cmdline="/usr/libexec/ibus-extension-gtk3",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60911,
                     cmdline="/usr/libexec/ibus-x11 --kill-daemon",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60913,
                     cmdline="/usr/libexec/ibus-portal",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60921,
                     cmdline="/usr/libexec/dconf-service",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60933,
                     cmdline="/usr/libexec/evolution-source-registry",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60955,
                     cmdline="/usr/libexec/goa-daemon",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60960,
                     cmdline="/usr/libexec/gvfs-udisks2-volume-monitor",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60967,
                     cmdline="/usr/libexec/goa-identity-service",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60973,
                     cmdline="/usr/libexec/gvfs-goa-volume-monitor",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60981,
                     cmdline="/usr/libexec/gvfs-mtp-volume-monitor",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60986,
                     cmdline="/usr/libexec/gvfs-gphoto2-volume-monitor",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=60991,
                     cmdline="/usr/libexec/gvfs-afc-volume-monitor",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61000,
                     cmdline="/usr/libexec/gsd-power",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61002,
                     cmdline="/usr/libexec/gsd-print-notifications",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61003,
                     cmdline="/usr/libexec/gsd-rfkill",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61004,
                     cmdline="/usr/libexec/gsd-screensaver-proxy",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61005,
                     cmdline="/usr/libexec/gsd-sharing",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61006,
                     cmdline="/usr/libexec/gsd-smartcard",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61007,
                     cmdline="/usr/libexec/gsd-sound",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61008,
                     cmdline="/usr/libexec/gsd-xsettings",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61009,
                     cmdline="/usr/libexec/gsd-wacom",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61012,
                     cmdline="/usr/libexec/gsd-account",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61013,
                     cmdline="/usr/libexec/gsd-a11y-settings",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61014,
                     cmdline="/usr/libexec/gsd-clipboard",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61015,
                     cmdline="/usr/libexec/gsd-color",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61016,
                     cmdline="/usr/libexec/gsd-datetime",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61017,
                     cmdline="/usr/libexec/gsd-housekeeping",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61018,
                     cmdline="/usr/libexec/gsd-keyboard",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61019,
                     cmdline="/usr/libexec/gsd-media-keys",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61020,
                     cmdline="/usr/libexec/gsd-mouse",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61021,
                     cmdline="/usr/libexec/gsd-subman",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61025,
                     cmdline="/usr/libexec/evolution-calendar-factory",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61028,
                     cmdline="/usr/bin/pulseaudio --start",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61069,
                     cmdline="/usr/libexec/gsd-printer",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61071,
                     cmdline="/usr/libexec/ibus-engine-simple",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61129,
                     cmdline="/usr/libexec/evolution-calendar-factory-subprocess --factory all --bus-name org.gnome.evolution.",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61149,
                     cmdline="/usr/libexec/evolution-addressbook-factory",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61164,
                     cmdline="/usr/libexec/evolution-addressbook-factory-subprocess --factory all --bus-name org.gnome.evoluti",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61719,
                     cmdline="/usr/libexec/gsd-disk-utility-notify",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=61723,
                     cmdline="/usr/libexec/evolution/evolution-alarm-notify",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=67645,
                     cmdline="/usr/libexec/gvfsd-trash --spawner :1.8 /org/gtk/gvfs/exec_spaw/0",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=172491,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=172639,
                     cmdline="ssh hpc21",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=172640,
                     cmdline="ssh jump-slot ssh-proxy hpc21",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=549838,
                     cmdline="more run.yaml",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=575856,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=576030,
                     cmdline="ssh hpc23",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=576031,
                     cmdline="ssh jump-slot ssh-proxy hpc23",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=630339,
                     cmdline="/usr/libexec/gvfsd-http --spawner :1.8 /org/gtk/gvfs/exec_spaw/4",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=769669,
                     cmdline="bash /opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/tec360 file.dat",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=769681,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/tec360-bin file.dat",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=769997,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-z",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=769998,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-s",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=770009,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=utility --ena",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=770014,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=renderer --no",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809224,
                     cmdline="bash /opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/tec360 untitled.lay",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809236,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/tec360-bin untitled.lay",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809550,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-z",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809551,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-s",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809564,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=utility --ena",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=809571,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=renderer --no",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=837903,
                     cmdline="bash /opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/tec360 velo.lay",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=838229,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-z",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=838230,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=zygote --no-s",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=838243,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=utility --ena",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=838249,
                     cmdline="/opt/software/tecplot/tecplot360-2024R1/360ex_2024r1/bin/QtWebEngineProcess --type=renderer --no",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=881543,
                     cmdline="/usr/bin/ssh-agent -D -a /home/auser/.cache/keyring-0X1RX2/.ssh",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=881602,
                     cmdline="ssh -fNqx jump-main",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=881730,
                     cmdline="ssh -fNqx jump-main",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=938821,
                     cmdline="/usr/libexec/gvfsd-metadata",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=989792,
                     cmdline="ssh -fNqx jump-main",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1029041,
                     cmdline="/usr/libexec/gvfsd-network --spawner :1.8 /org/gtk/gvfs/exec_spaw/1",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1029158,
                     cmdline="/usr/libexec/gvfsd-dnssd --spawner :1.8 /org/gtk/gvfs/exec_spaw/3",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1536330,
                     cmdline="/usr/bin/nautilus --gapplication-service",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1539823,
                     cmdline="eog /storage/auser/Project/Subproject/File",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1602583,
                     cmdline="paraview",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1602590,
                     cmdline="/opt/software/paraview/5.13.0/bin/paraview-real",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1740637,
                     cmdline="/usr/libexec/gnome-terminal-server",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1740647,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1742445,
                     cmdline="ssh hpc25",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1742446,
                     cmdline="ssh jump-slot ssh-proxy hpc25",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=1765602,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2012476,
                     cmdline="scp auser@hpc25:/storagep18/auser/Project/Subproject/002.* .",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2012477,
                     cmdline="/usr/bin/ssh -x -oForwardAgent=no -oPermitLocalCommand=no -oClearAllForwardings=yes -oRemoteComm",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2012478,
                     cmdline="ssh jump-slot ssh-proxy hpc25",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2012558,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2013114,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2467293,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2675914,
                     cmdline="./a.out",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2686802,
                     cmdline="/usr/bin/python3 test.py",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2686803,
                     cmdline="less",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2711041,
                     cmdline="/usr/libexec/xdg-desktop-portal",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2711048,
                     cmdline="/usr/libexec/xdg-document-portal",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2711058,
                     cmdline="fusermount -o rw,nosuid,nodev,fsname=portal,auto_unmount,subtype=portal -- /home/auser/.cache",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2711063,
                     cmdline="/usr/libexec/xdg-desktop-portal-gtk",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2733953,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=2744827,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=3453399,
                     cmdline="scp auser@hpc25:/storagep18/auser/Project/Subproject/000.* .",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=3453400,
                     cmdline="/usr/bin/ssh -x -oForwardAgent=no -oPermitLocalCommand=no -oClearAllForwardings=yes -oRemoteComm",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=3453401,
                     cmdline="ssh jump-slot ssh-proxy hpc25",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=3806099,
                     cmdline="more MakeTunnel.tcl",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4038438,
                     cmdline="bash",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4046677,
                     cmdline="scp auser@hpc25:/storagep18/auser/directory/ .",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4046678,
                     cmdline="/usr/bin/ssh -x -oForwardAgent=no -oPermitLocalCommand=no -oClearAllForwardings=yes -oRemoteComm",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4046679,
                     cmdline="ssh jump-slot ssh-proxy hpc25",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4120895,
                     cmdline="ssh hpc27",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ),
             stop_idle_sessions.ps.Process(
                     pid=4120896,
                     cmdline="ssh jump-slot ssh-proxy hpc27 ",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             )
         ]
 
 
+# Unlike the other scenarios, ss prints this table in wide, padded columns
+# pylint: disable=line-too-long
+_RAW_SS_OUTPUT = dedent("""\
+    LISTEN              0                128                               0.0.0.0:111                                0.0.0.0:*                users:(("rpcbind",pid=6505,fd=4),("systemd",pid=1,fd=407))
+    LISTEN              0                128                               0.0.0.0:22                                 0.0.0.0:*                users:(("sshd",pid=673008,fd=3))
+    LISTEN              0                128                             127.0.0.1:631                                0.0.0.0:*                users:(("cupsd",pid=6860,fd=8))
+    LISTEN              0                100                             127.0.0.1:25                                 0.0.0.0:*                users:(("master",pid=7650,fd=14))
+    LISTEN              0                128                               0.0.0.0:57027                              0.0.0.0:*                users:(("paraview-real",pid=1602590,fd=7))
+    LISTEN              0                32                                0.0.0.0:5901                               0.0.0.0:*                users:(("x11vnc",pid=1611110,fd=8))
+    LISTEN              0                5                               127.0.0.1:5902                               0.0.0.0:*                users:(("Xvnc",pid=69575,fd=6))
+    ESTAB               0                0                           192.168.34.80:45774                        192.168.99.40:22               users:(("ssh",pid=881602,fd=3))
+    TIME-WAIT           0                0                           192.168.34.80:33092                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33124                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37624                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36360                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36354                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37740                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36236                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36226                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37664                        192.168.2.100:3128
+    ESTAB               0                0                               127.0.0.1:45502                            127.0.0.1:5901             users:(("sshd",pid=1618023,fd=7))
+    TIME-WAIT           0                0                           192.168.34.80:37644                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37630                        192.168.2.100:3128
+    ESTAB               24               0                           192.168.34.80:44784                        192.168.0.124:1780             users:(("tec360-bin",pid=809236,fd=28))
+    TIME-WAIT           0                0                           192.168.34.80:36278                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:959                          192.168.0.202:2049
+    TIME-WAIT           0                0                           192.168.34.80:33166                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33180                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36294                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36382                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33150                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37620                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36284                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33140                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37710                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37756                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37758                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33068                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37702                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37738                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33128                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37654                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:34782                       192.168.121.30:9997             users:(("splunkd",pid=7751,fd=183))
+    TIME-WAIT           0                0                           192.168.34.80:33086                        192.168.2.100:3128
+    ESTAB               15               0                           192.168.34.80:48916                        192.168.0.124:1780             users:(("tec360-bin",pid=769681,fd=28))
+    TIME-WAIT           0                0                           192.168.34.80:36326                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37674                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37328                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36366                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33080                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37726                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36308                        192.168.2.100:3128
+    ESTAB               0                0                               127.0.0.1:5901                             127.0.0.1:45502            users:(("x11vnc",pid=1611110,fd=11))
+    TIME-WAIT           0                0                           192.168.34.80:33108                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36270                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:35498                        192.168.99.40:22               users:(("ssh",pid=989792,fd=3))
+    TIME-WAIT           0                0                           192.168.34.80:36338                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36248                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37326                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36262                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36322                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36218                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:22                            192.168.0.53:52338            users:(("sshd",pid=1602211,fd=4),("sshd",pid=1602192,fd=4))
+    ESTAB               0                0                           192.168.34.80:59196                        192.168.99.40:22               users:(("ssh",pid=881730,fd=3))
+    TIME-WAIT           0                0                           192.168.34.80:37780                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37690                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:36346                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37762                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:903                          192.168.0.203:2049
+    TIME-WAIT           0                0                           192.168.34.80:36286                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:37770                        192.168.2.100:3128
+    TIME-WAIT           0                0                           192.168.34.80:33192                        192.168.2.100:3128
+    ESTAB               0                2716                        192.168.34.80:22                            192.168.7.14:49764            users:(("sshd",pid=1618023,fd=4),("sshd",pid=1617896,fd=4))
+    TIME-WAIT           0                0                           192.168.34.80:37746                        192.168.2.100:3128
+    ESTAB               0                0                           192.168.34.80:33206                        192.168.2.100:3128             users:(("platform-python",pid=1621488,fd=40))
+    ESTAB               0                0                           192.168.34.80:22                            192.168.0.53:35578            users:(("sshd",pid=1612676,fd=4),("sshd",pid=1612636,fd=4))
+    TIME-WAIT           0                0                           192.168.34.80:33054                        192.168.2.100:3128
+    LISTEN              0                128                                  [::]:111                                   [::]:*                users:(("rpcbind",pid=6505,fd=6),("systemd",pid=1,fd=409))
+    LISTEN              0                128                                 [::1]:631                                   [::]:*                users:(("cupsd",pid=6860,fd=7))
+    LISTEN              0                100                                 [::1]:25                                    [::]:*                users:(("master",pid=7650,fd=15))
+    LISTEN              0                32                                   [::]:5900                                  [::]:*                users:(("x11vnc",pid=1611110,fd=9))
+    LISTEN              0                32                                   [::]:5901                                  [::]:*                users:(("x11vnc",pid=1611110,fd=10))
+    LISTEN              0                5                                   [::1]:5902                                  [::]:*                users:(("Xvnc",pid=69575,fd=7))
+    ESTAB               0                0                 [::ffff:192.168.35.153]:34152               [::ffff:192.168.99.10]:52311            users:(("BESClient",pid=6206,fd=25))
+    LISTEN              0                80                                      *:3306                                     *:*                users:(("mysqld",pid=11827,fd=22))
+    LISTEN              0                10                                      *:47827                                    *:*                users:(("star-ccm+",pid=1616815,fd=7))
+    LISTEN              0                2048                                    *:9000                                     *:*                users:(("java",pid=4137270,fd=395))
+    LISTEN              0                50                     [::ffff:127.0.0.1]:34695                                    *:*                users:(("java",pid=3276197,fd=391))
+    LISTEN              0                2                      [::ffff:127.0.0.1]:45481                                    *:*                users:(("java",pid=503653,fd=25))
+""")
+# pylint: enable=line-too-long
+
+_EXPECTED_LISTENING_PORTS: FrozenSet[int] = frozenset((22, 25, 111, 631, 3306,
+                                                       5900, 5901, 5902, 9000,
+                                                       34695, 45481, 47827,
+                                                       57027))
+
+_EXPECTED_PEER_PAIRS: FrozenSet[Tuple[Union[IPv4Address, IPv6Address],
+                                      int]] = frozenset([
+    (ip_address("192.168.99.40"), 22),
+    (ip_address("127.0.0.1"), 5901),
+    (ip_address("192.168.0.124"), 1780),
+    (ip_address("192.168.121.30"), 9997),
+    (ip_address("192.168.0.124"), 1780),
+    (ip_address("127.0.0.1"), 45502),
+    (ip_address("192.168.99.40"), 22),
+    (ip_address("192.168.0.53"), 52338),
+    (ip_address("192.168.99.40"), 22),
+    (ip_address("192.168.7.14"), 49764),
+    (ip_address("192.168.2.100"), 3128),
+    (ip_address("192.168.0.53"), 35578),
+    (ip_address("192.168.0.203"), 2049),
+    (ip_address("192.168.0.202"), 2049),
+    (ip_address("::ffff:c0a8:630a"), 52311)
+])
+
+# The single SSH tunnel into VNC, which terminates at x11vnc instead of Xvnc
+_LOOPBACK_CONNECTIONS: Tuple[stop_idle_sessions.ss.LoopbackConnection, ...] = (
+    stop_idle_sessions.ss.LoopbackConnection(
+            client=stop_idle_sessions.ss.Socket(
+                addr=ip_address('127.0.0.1'),
+                port=45502,
+                processes=[stop_idle_sessions.ps.Process(
+                    pid=1618023,
+                    cmdline="sshd: auser@pts/0",
+                    environ=test_ps.EMPTY_ENVIRON
+                )]
+            ),
+            server=stop_idle_sessions.ss.Socket(
+                addr=ip_address('127.0.0.1'),
+                port=5901,
+                processes=[stop_idle_sessions.ps.Process(
+                    pid=1611110,
+                    cmdline="x11vnc -display :1 -autoport 5901",
+                    environ=test_ps.EMPTY_ENVIRON
+                )]
+            )
+    ),
+)
+
+
 class Scenario3LoopbackConnectionTestCase(test_ss.LoopbackConnectionTestCase):
     """Scenario3 unit testing for the ss module
 
@@ -990,120 +1132,16 @@ class Scenario3LoopbackConnectionTestCase(test_ss.LoopbackConnectionTestCase):
 
     def _mock_raw_ss_output(self) -> str:
         """Input data to populate the mocked network connections table"""
-        return dedent("""\
-            LISTEN              0                128                               0.0.0.0:111                                0.0.0.0:*                users:(("rpcbind",pid=6505,fd=4),("systemd",pid=1,fd=407))
-            LISTEN              0                128                               0.0.0.0:22                                 0.0.0.0:*                users:(("sshd",pid=673008,fd=3))
-            LISTEN              0                128                             127.0.0.1:631                                0.0.0.0:*                users:(("cupsd",pid=6860,fd=8))
-            LISTEN              0                100                             127.0.0.1:25                                 0.0.0.0:*                users:(("master",pid=7650,fd=14))
-            LISTEN              0                128                               0.0.0.0:57027                              0.0.0.0:*                users:(("paraview-real",pid=1602590,fd=7))
-            LISTEN              0                32                                0.0.0.0:5901                               0.0.0.0:*                users:(("x11vnc",pid=1611110,fd=8))
-            LISTEN              0                5                               127.0.0.1:5902                               0.0.0.0:*                users:(("Xvnc",pid=69575,fd=6))
-            ESTAB               0                0                           192.168.34.80:45774                        192.168.99.40:22               users:(("ssh",pid=881602,fd=3))
-            TIME-WAIT           0                0                           192.168.34.80:33092                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33124                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37624                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36360                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36354                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37740                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36236                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36226                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37664                        192.168.2.100:3128
-            ESTAB               0                0                               127.0.0.1:45502                            127.0.0.1:5901             users:(("sshd",pid=1618023,fd=7))
-            TIME-WAIT           0                0                           192.168.34.80:37644                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37630                        192.168.2.100:3128
-            ESTAB               24               0                           192.168.34.80:44784                        192.168.0.124:1780             users:(("tec360-bin",pid=809236,fd=28))
-            TIME-WAIT           0                0                           192.168.34.80:36278                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:959                          192.168.0.202:2049
-            TIME-WAIT           0                0                           192.168.34.80:33166                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33180                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36294                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36382                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33150                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37620                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36284                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33140                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37710                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37756                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37758                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33068                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37702                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37738                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33128                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37654                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:34782                       192.168.121.30:9997             users:(("splunkd",pid=7751,fd=183))
-            TIME-WAIT           0                0                           192.168.34.80:33086                        192.168.2.100:3128
-            ESTAB               15               0                           192.168.34.80:48916                        192.168.0.124:1780             users:(("tec360-bin",pid=769681,fd=28))
-            TIME-WAIT           0                0                           192.168.34.80:36326                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37674                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37328                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36366                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33080                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37726                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36308                        192.168.2.100:3128
-            ESTAB               0                0                               127.0.0.1:5901                             127.0.0.1:45502            users:(("x11vnc",pid=1611110,fd=11))
-            TIME-WAIT           0                0                           192.168.34.80:33108                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36270                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:35498                        192.168.99.40:22               users:(("ssh",pid=989792,fd=3))
-            TIME-WAIT           0                0                           192.168.34.80:36338                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36248                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37326                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36262                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36322                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36218                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:22                            192.168.0.53:52338            users:(("sshd",pid=1602211,fd=4),("sshd",pid=1602192,fd=4))
-            ESTAB               0                0                           192.168.34.80:59196                        192.168.99.40:22               users:(("ssh",pid=881730,fd=3))
-            TIME-WAIT           0                0                           192.168.34.80:37780                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37690                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:36346                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37762                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:903                          192.168.0.203:2049
-            TIME-WAIT           0                0                           192.168.34.80:36286                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:37770                        192.168.2.100:3128
-            TIME-WAIT           0                0                           192.168.34.80:33192                        192.168.2.100:3128
-            ESTAB               0                2716                        192.168.34.80:22                            192.168.7.14:49764            users:(("sshd",pid=1618023,fd=4),("sshd",pid=1617896,fd=4))
-            TIME-WAIT           0                0                           192.168.34.80:37746                        192.168.2.100:3128
-            ESTAB               0                0                           192.168.34.80:33206                        192.168.2.100:3128             users:(("platform-python",pid=1621488,fd=40))
-            ESTAB               0                0                           192.168.34.80:22                            192.168.0.53:35578            users:(("sshd",pid=1612676,fd=4),("sshd",pid=1612636,fd=4))
-            TIME-WAIT           0                0                           192.168.34.80:33054                        192.168.2.100:3128
-            LISTEN              0                128                                  [::]:111                                   [::]:*                users:(("rpcbind",pid=6505,fd=6),("systemd",pid=1,fd=409))
-            LISTEN              0                128                                 [::1]:631                                   [::]:*                users:(("cupsd",pid=6860,fd=7))
-            LISTEN              0                100                                 [::1]:25                                    [::]:*                users:(("master",pid=7650,fd=15))
-            LISTEN              0                32                                   [::]:5900                                  [::]:*                users:(("x11vnc",pid=1611110,fd=9))
-            LISTEN              0                32                                   [::]:5901                                  [::]:*                users:(("x11vnc",pid=1611110,fd=10))
-            LISTEN              0                5                                   [::1]:5902                                  [::]:*                users:(("Xvnc",pid=69575,fd=7))
-            ESTAB               0                0                 [::ffff:192.168.35.153]:34152               [::ffff:192.168.99.10]:52311            users:(("BESClient",pid=6206,fd=25))
-            LISTEN              0                80                                      *:3306                                     *:*                users:(("mysqld",pid=11827,fd=22))
-            LISTEN              0                10                                      *:47827                                    *:*                users:(("star-ccm+",pid=1616815,fd=7))
-            LISTEN              0                2048                                    *:9000                                     *:*                users:(("java",pid=4137270,fd=395))
-            LISTEN              0                50                     [::ffff:127.0.0.1]:34695                                    *:*                users:(("java",pid=3276197,fd=391))
-            LISTEN              0                2                      [::ffff:127.0.0.1]:45481                                    *:*                users:(("java",pid=503653,fd=25))
-        """)
-
-    def _expected_listening_ports(self) -> Set[int]:
+        return _RAW_SS_OUTPUT
+
+    def _expected_listening_ports(self) -> AbstractSet[int]:
         """Expected set of listening ports parsed out of the mock ss data"""
-        return set([22, 25, 111, 631, 3306, 5900, 5901, 5902, 9000, 34695,
-                    45481, 47827, 57027])
+        return _EXPECTED_LISTENING_PORTS
 
-    def _expected_peer_pairs(self) -> Set[Tuple[Union[IPv4Address,
-                                                      IPv6Address], int]]:
+    def _expected_peer_pairs(self) -> AbstractSet[Tuple[Union[IPv4Address,
+                                                              IPv6Address], int]]:
         """Expected set of remote peers parsed from the established conns"""
-        return set([
-                (ip_address("192.168.99.40"), 22),
-                (ip_address("127.0.0.1"), 5901),
-                (ip_address("192.168.0.124"), 1780),
-                (ip_address("192.168.121.30"), 9997),
-                (ip_address("192.168.0.124"), 1780),
-                (ip_address("127.0.0.1"), 45502),
-                (ip_address("192.168.99.40"), 22),
-                (ip_address("192.168.0.53"), 52338),
-                (ip_address("192.168.99.40"), 22),
-                (ip_address("192.168.7.14"), 49764),
-                (ip_address("192.168.2.100"), 3128),
-                (ip_address("192.168.0.53"), 35578),
-                (ip_address("192.168.0.203"), 2049),
-                (ip_address("192.168.0.202"), 2049),
-                (ip_address("::ffff:c0a8:630a"), 52311)
-        ])
+        return _EXPECTED_PEER_PAIRS
 
     def _expected_connections(self) -> List[stop_idle_sessions.ss.LoopbackConnection]:
         """Expected set of loopback connections identified from these conns
@@ -1113,28 +1151,7 @@ class Scenario3LoopbackConnectionTestCase(test_ss.LoopbackConnectionTestCase):
         instead of Xvnc.
         """
 
-        return [
-            stop_idle_sessions.ss.LoopbackConnection(
-                    client=stop_idle_sessions.ss.Socket(
-                        addr=ip_address('127.0.0.1'),
-                        port=45502,
-                        processes=[stop_idle_sessions.ps.Process(
-                            pid=1618023,
-                            cmdline="sshd: auser@pts/0",
-                            environ={}
-                        )]
-                    ),
-                    server=stop_idle_sessions.ss.Socket(
-                        addr=ip_address('127.0.0.1'),
-                        port=5901,
-                        processes=[stop_idle_sessions.ps.Process(
-                            pid=1611110,
-                            cmdline="x11vnc -display :1 -autoport 5901",
-                            environ={}
-                        )]
-                    )
-            )
-        ]
+        return list(_LOOPBACK_CONNECTIONS)
 
 
 class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
@@ -1210,28 +1227,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
 
     def _mock_find_loopback_connections(self) -> List[stop_idle_sessions.ss.LoopbackConnection]:
         """Input data to mock out the ss utility and module"""
-        return [
-            stop_idle_sessions.ss.LoopbackConnection(
-                client=stop_idle_sessions.ss.Socket(
-                    addr=ip_address('127.0.0.1'),
-                    port=45502,
-                    processes=[stop_idle_sessions.ps.Process(
-                        pid=1618023,
-                        cmdline="sshd: auser@pts/0",
-                        environ={}
-                    )]
-                ),
-                server=stop_idle_sessions.ss.Socket(
-                    addr=ip_address('127.0.0.1'),
-                    port=5901,
-                    processes=[stop_idle_sessions.ps.Process(
-                        pid=1611110,
-                        cmdline="x11vnc -display :1 -autoport 5901",
-                        environ={}
-                    )]
-                )
-            )
-        ]
+        return list(_LOOPBACK_CONNECTIONS)
 
     # Yeah well, we have seven scopes to return :-D
     # pylint: disable-next=too-many-return-statements
@@ -1240,35 +1236,27 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
         """Input data to mock out the ps and cgroup interface module"""
 
         if scope_path == "/user.slice/user-0.slice/session-4089.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [1602192, 1602211, 1602212]))
 
         if scope_path == "/user.slice/user-1000.slice/session-4096.scope":
-            pids = list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            pids = list(map(test_ps.stub_process,
                              [1607896, 1608023, 1608025]))
 
             pids.append(stop_idle_sessions.ps.Process(
                     pid=1611110,
                     cmdline="x11vnc -display :1 -autoport 5901",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ))
 
             return pids
 
         if scope_path == "/user.slice/user-21106.slice/session-4098.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [1612636, 1612676]))
 
         if scope_path == "/user.slice/user-0.slice/session-65.scope":
-            pids = list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            pids = list(map(test_ps.stub_process,
                             [60792, 60793, 60808, 60823, 60828, 60831, 60835,
                              60842, 60870, 60884, 60900, 60902, 60904, 60908,
                              60909, 60911, 60913, 60921, 60933, 60955, 60960,
@@ -1293,7 +1281,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
             pids.append(stop_idle_sessions.ps.Process(
                     pid=60750,
                     cmdline="/bin/sh /usr/bin/startx -- :1",
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ))
             pids.append(stop_idle_sessions.ps.Process(
                     pid=60770,
@@ -1305,7 +1293,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                     pid=60771,
                     cmdline=("/usr/libexec/Xorg :1 -auth "
                              "/home/auser/.serverauth.60750"),
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ))
             pids.append(stop_idle_sessions.ps.Process(
                     pid=60776,
@@ -1317,15 +1305,11 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
             return pids
 
         if scope_path == "/user.slice/user-1000.slice/session-72.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [59989, 60053]))
 
         if scope_path == "/user.slice/user-1000.slice/session-82.scope":
-            pids = list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            pids = list(map(test_ps.stub_process,
                             [68243, 68310, 69607, 69608, 69698, 69703, 69708,
                              69710, 69718, 69728, 69729, 69733, 69738, 69739,
                              69750, 69755, 69760, 69761, 69762, 69763, 69764,
@@ -1339,7 +1323,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                     cmdline=("/usr/bin/Xvnc :2 -auth "
                              "/home/auser/.Xauthority -desktop "
                              "workstation.example.com:2 (auser) -f"),
-                    environ={}
+                    environ=test_ps.EMPTY_ENVIRON
             ))
             pids.append(stop_idle_sessions.ps.Process(
                     pid=69590,
@@ -1355,9 +1339,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
             return pids
 
         if scope_path == "/user.slice/user-1000.slice/session-4100.scope":
-            return list(map(lambda pid: stop_idle_sessions.ps.Process(pid=pid,
-                                                                      cmdline="",
-                                                                      environ={}),
+            return list(map(test_ps.stub_process,
                             [1617896, 1618023, 1618025]))
 
         raise KeyError(f'Unexpected scope argument: {scope_path}')
@@ -1491,21 +1473,15 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='root',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1602192,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1602192),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1602211,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1602211),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1602212,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1602212),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -1517,28 +1493,22 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=datetime.timedelta(seconds=3 * 60),
                 username='auser',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1607896,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1607896),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1608023,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1608023),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1608025,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1608025),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
                                 process=stop_idle_sessions.ps.Process(
                                     pid=1611110,
                                     cmdline="x11vnc -display :1 -autoport 5901",
-                                    environ={}
+                                    environ=test_ps.EMPTY_ENVIRON
                                 ),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
@@ -1551,15 +1521,11 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='ansible',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1612636,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1612636),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1612676,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1612676),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -1574,7 +1540,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                                 process=stop_idle_sessions.ps.Process(
                                     pid=60750,
                                     cmdline="/bin/sh /usr/bin/startx -- :1",
-                                    environ={}
+                                    environ=test_ps.EMPTY_ENVIRON
                                 ),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
@@ -1594,7 +1560,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                                     pid=60771,
                                     cmdline=("/usr/libexec/Xorg :1 -auth "
                                              "/home/auser/.serverauth.60750"),
-                                    environ={}
+                                    environ=test_ps.EMPTY_ENVIRON
                                 ),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
@@ -1609,729 +1575,487 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60792,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60792),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60793,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60793),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60808,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60808),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60823,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60823),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60828,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60828),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60831,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60831),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60835,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60835),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60842,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60842),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60870,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60870),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60884,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60884),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60900,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60900),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60902,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60902),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60904,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60904),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60908,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60908),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60909,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60909),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60911,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60911),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60913,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60913),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60921,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60921),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60933,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60933),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60955,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60955),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60960,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60960),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60967,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60967),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60973,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60973),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60981,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60981),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60986,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60986),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60991,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60991),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61000,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61000),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61002,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61002),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61003,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61003),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61004,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61004),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61005,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61005),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61006,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61006),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61007,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61007),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61008,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61008),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61009,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61009),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61012,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61012),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61013,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61013),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61014,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61014),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61015,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61015),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61016,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61016),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61017,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61017),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61018,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61018),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61019,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61019),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61020,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61020),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61021,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61021),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61025,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61025),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61028,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61028),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61069,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61069),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61071,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61071),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61129,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61129),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61149,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61149),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61164,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61164),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61719,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61719),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=61723,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(61723),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=67645,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(67645),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=172491,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(172491),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=172639,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(172639),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=172640,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(172640),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=549838,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(549838),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=575856,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(575856),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=576030,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(576030),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=576031,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(576031),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=630339,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(630339),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=769669,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(769669),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=769681,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(769681),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=769997,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(769997),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=769998,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(769998),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=770009,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(770009),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=770014,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(770014),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809224,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809224),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809236,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809236),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809550,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809550),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809551,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809551),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809564,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809564),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=809571,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(809571),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=837903,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(837903),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=838229,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(838229),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=838230,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(838230),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=838243,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(838243),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=838249,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(838249),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=881543,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(881543),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=881602,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(881602),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=881730,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(881730),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=938821,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(938821),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=989792,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(989792),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1029041,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1029041),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1029158,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1029158),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1536330,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1536330),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1539823,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1539823),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1602583,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1602583),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1602590,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1602590),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1740637,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1740637),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1740647,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1740647),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1742445,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1742445),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1742446,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1742446),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1765602,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1765602),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2012476,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2012476),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2012477,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2012477),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2012478,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2012478),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2012558,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2012558),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2013114,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2013114),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2467293,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2467293),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2675914,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2675914),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2686802,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2686802),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2686803,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2686803),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2711041,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2711041),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2711048,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2711048),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2711058,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2711058),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2711063,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2711063),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2733953,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2733953),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=2744827,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(2744827),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=3453399,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(3453399),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=3453400,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(3453400),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=3453401,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(3453401),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=3806099,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(3806099),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4038438,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4038438),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4046677,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4046677),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4046678,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4046678),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4046679,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4046679),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4120895,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4120895),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=4120896,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(4120896),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -2343,15 +2067,11 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='auser',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=59989,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(59989),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=60053,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(60053),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -2370,7 +2090,7 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                                              "-desktop "
                                              "workstation.example.com:2 "
                                              "(auser) -f"),
-                                    environ={}
+                                    environ=test_ps.EMPTY_ENVIRON
                                 ),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
@@ -2391,255 +2111,171 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=68243,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(68243),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=68310,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(68310),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69607,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69607),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69608,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69608),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69698,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69698),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69703,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69703),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69708,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69708),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69710,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69710),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69718,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69718),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69728,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69728),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69729,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69729),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69733,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69733),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69738,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69738),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69739,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69739),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69750,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69750),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69755,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69755),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69760,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69760),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69761,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69761),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69762,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69762),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69763,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69763),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69764,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69764),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69785,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69785),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69791,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69791),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69794,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69794),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69803,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69803),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69813,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69813),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69819,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69819),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69852,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69852),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69863,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69863),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69871,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69871),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69880,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69880),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69892,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69892),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69895,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69895),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69905,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69905),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69919,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69919),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69922,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69922),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69935,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69935),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69944,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69944),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69947,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69947),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69972,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69972),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=69985,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(69985),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=92366,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(92366),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
@@ -2651,27 +2287,21 @@ class Scenario3MainLoopTestCase(test_main.MainLoopTestCase):
                 display_idle=None,
                 username='auser',
                 processes=[stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1617896,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1617896),
                                 tunneled_processes=[],
                                 tunneled_sessions=[]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1618023,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1618023),
                                 tunneled_processes=[
                                     stop_idle_sessions.ps.Process(
                                         pid=1611110,
                                         cmdline="x11vnc -display :1 -autoport 5901",
-                                        environ={}
+                                        environ=test_ps.EMPTY_ENVIRON
                                     )
                                 ],
                                 tunneled_sessions=[session_4096]),
                            stop_idle_sessions.main.SessionProcess(
-                                process=stop_idle_sessions.ps.Process(pid=1618025,
-                                                                      cmdline="",
-                                                                      environ={}),
+                                process=test_ps.stub_process(1618025),
                                 tunneled_processes=[],
                                 tunneled_sessions=[])]
         )
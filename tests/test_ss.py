@@ -3,7 +3,8 @@
 
 from ipaddress import IPv4Address, IPv6Address
 from os.path import basename
-from typing import List, Set, Tuple, Union
+from types import SimpleNamespace
+from typing import AbstractSet, List, Tuple, Union
 from unittest import TestCase, TestSuite
 from unittest.mock import Mock, patch
 
@@ -28,12 +29,12 @@ class LoopbackConnectionTestCase(TestCase):
         """Subclasses should override this method"""
         raise NotImplementedError('_mock_raw_ss_output')
 
-    def _expected_listening_ports(self) -> Set[int]:
+    def _expected_listening_ports(self) -> AbstractSet[int]:
         """Subclasses should override this method"""
         raise NotImplementedError('_expected_listening_ports')
 
-    def _expected_peer_pairs(self) -> Set[Tuple[Union[IPv4Address,
-                                                      IPv6Address], int]]:
+    def _expected_peer_pairs(self) -> AbstractSet[Tuple[Union[IPv4Address,
+                                                              IPv6Address], int]]:
         """Subclasses should override this method"""
         raise NotImplementedError('_expected_peer_pairs')
 
@@ -88,14 +89,12 @@ class LoopbackConnectionTestCase(TestCase):
     # Internal methods used by test cases -- these should not be overridden
     #
 
-    def _subprocess_run_with_check(self, *args, **_) -> Mock:
+    def _subprocess_run_with_check(self, *args, **_) -> SimpleNamespace:
         """Mock the subprocess.run call with a check for 'ss' command"""
 
         if basename(args[0][0]) != "ss":
             raise ValueError(f"Unexpected command {args[0]}")
-        completed_process = Mock()
-        completed_process.stdout = self._mock_raw_ss_output()
-        return completed_process
+        return SimpleNamespace(stdout=self._mock_raw_ss_output())
 
     #
     # Internal attributes used by test cases -- subclasses shouldn't use these
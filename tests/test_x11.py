@@ -6,6 +6,9 @@ from typing import Mapping, Optional, Tuple
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
+import Xlib.error
+
+from stop_idle_sessions.exception import SessionParseError
 from stop_idle_sessions.ps import Process
 import stop_idle_sessions.x11
 
@@ -45,6 +48,53 @@ class ParseCommandLineTestCase(TestCase):
         self.assertEqual(expected_results, actual_results)
 
 
+class RetrieveIdleTimeTestCase(TestCase):
+    """Verify the handling of the X11 connection used to query idletime"""
+
+    def setUp(self):
+        self._mocked_display = Mock()
+        self._mocked_display.has_extension = Mock(return_value=True)
+        mocked_root = self._mocked_display.screen.return_value.root
+        mocked_root.screensaver_query_info.return_value.idle = 5000
+
+        display_patcher = patch('Xlib.display.Display',
+                                new=Mock(return_value=self._mocked_display))
+        display_patcher.start()
+        self.addCleanup(display_patcher.stop)
+
+        environ_patcher = patch.dict('os.environ')
+        environ_patcher.start()
+        self.addCleanup(environ_patcher.stop)
+
+    def test_connection_closed_after_query(self):
+        """The connection to the X11 server should not be left open"""
+
+        idletime = stop_idle_sessions.x11.X11DisplayCollector.retrieve_idle_time(
+                ':1',
+                '/home/auser/.Xauthority'
+        )
+
+        self.assertEqual(idletime, timedelta(milliseconds=5000))
+        self._mocked_display.close.assert_called_once()
+
+    def test_close_failure_keeps_idletime(self):
+        """A connection which drops while closing shouldn't lose the idletime"""
+
+        self._mocked_display.close.side_effect = Xlib.error.ConnectionClosedError(':1')
+
+        with self.assertLogs('stop_idle_sessions.x11', level='DEBUG'):
+            idletime = stop_idle_sessions.x11.X11DisplayCollector.retrieve_idle_time(
+                    ':1',
+                    '/home/auser/.Xauthority'
+            )
+
+        self.assertEqual(idletime, timedelta(milliseconds=5000))
+        self._mocked_display.close.assert_called_once()
+
+    # The mocked Xlib.display.Display instance returned by the constructor
+    _mocked_display: Mock
+
+
 class X11DisplayCollectorTestCase(TestCase):
     """Verify correct accumulation and handling of process information"""
 
@@ -166,3 +216,78 @@ class X11DisplayCollectorTestCase(TestCase):
         )
 
         self._mocked_retrieve_idle_time.assert_not_called()
+
+    def test_shared_display_across_sessions(self):
+        """Several sessions which share a DISPLAY should only query it once
+
+        This is similar to an x11vnc relay, where a separate session carries
+        processes pointing at the same DISPLAY as the X server's own session.
+        Only one query should be issued per DISPLAY and XAUTHORITY pair, and
+        each session should then be answered from that result.
+        """
+
+        bag = stop_idle_sessions.x11.X11DisplayCollector()
+        bag.add('session_a', Process(
+                pid=20272,
+                cmdline=('/usr/bin/Xvnc :1 -auth /home/auser/.Xauthority '
+                         '-desktop remotehost.remotedomain (auser) -fp '
+                         'catalogue:/etc/X11/fontpath.d -geometry 1024x768 '
+                         '-pn -rfbauth /home/auser/.vnc/passwd -rfbport '
+                         '5901 -localhost'),
+                environ={}
+        ))
+        bag.add('session_b', Process(
+                pid=20301,
+                cmdline='/usr/bin/gnome-terminal',
+                environ={
+                    'DISPLAY': ':1',
+                    'XAUTHORITY': '/home/auser/.Xauthority'
+                }
+        ))
+
+        self.assertEqual(
+                bag.retrieve_least_display_idletime('session_a'),
+                (':1', timedelta(seconds=1200))
+        )
+        self.assertEqual(
+                bag.retrieve_least_display_idletime('session_b'),
+                (':1', timedelta(seconds=1200))
+        )
+        self._mocked_retrieve_idle_time.assert_called_once_with(
+                ':1', '/home/auser/.Xauthority'
+        )
+
+    def test_shared_display_failure_across_sessions(self):
+        """A failed query for a shared DISPLAY is not repeated, but re-raised
+
+        Each session should receive its own SessionParseError, chained to the
+        one which was originally raised (and stored) for the query.
+        """
+
+        stored_error = SessionParseError('Could not connect to X11 display '
+                                         'identified by ":3"')
+        self._mocked_retrieve_idle_time.side_effect = stored_error
+
+        bag = stop_idle_sessions.x11.X11DisplayCollector()
+        for session, pid in (('session_a', 30001), ('session_b', 30002)):
+            bag.add(session, Process(
+                    pid=pid,
+                    cmdline='/usr/bin/gnome-terminal',
+                    environ={
+                        'DISPLAY': ':3',
+                        'XAUTHORITY': '/home/auser/.Xauthority'
+                    }
+            ))
+
+        raised_errors = []
+        for session in ('session_a', 'session_b'):
+            with self.assertRaises(SessionParseError) as raised:
+                bag.retrieve_least_display_idletime(session)
+            self.assertIs(raised.exception.__cause__, stored_error)
+            self.assertEqual(raised.exception.message, stored_error.message)
+            raised_errors.append(raised.exception)
+
+        self.assertIsNot(raised_errors[0], raised_errors[1])
+        self._mocked_retrieve_idle_time.assert_called_once_with(
+                ':3', '/home/auser/.Xauthority'
+        )